@@ -1,32 +1,36 @@
 # src\vi_app\commands\cleanup.py
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
-from rich.progress import (
-    BarColumn,
-    Progress,
-    TaskProgressColumn,
-    TextColumn,
-    TimeRemainingColumn,
+from rich.progress import Progress, TaskID
+
+from vi_app.commands.common import (
+    confirm_or_default,
+    echo_lines,
+    prompt_existing_dir,
+    prompt_or_default,
+    resolve_dry_run,
+)
+from vi_app.core.rich_progress import (
+    REFRESH_PER_SECOND,
+    ThrottledTask,
+    make_phase_progress,
+    progress_columns,
 )
-
-from vi_app.commands.common import prompt_existing_dir, resolve_dry_run
-from vi_app.core.rich_progress import make_phase_progress
 from vi_app.modules.cleanup.schemas import (
     RemoveFilesRequest,
     RemoveFoldersRequest,
     SortRequest,
     SortStrategy,
 )
-from vi_app.modules.cleanup.service import (
-    RemoveFilesService,
-    RemoveFoldersService,
-    RenameService,
-    SortService,
-)
+
+if TYPE_CHECKING:
+    from vi_app.modules.cleanup.service import RenameService
 
 app = typer.Typer(help="Cleanup commands")
 
@@ -50,17 +54,17 @@ class RemoveFilesRunner:
             dry_run=self.dry_run,
             remove_empty_dirs=self.prune_empty,
         )
+        from vi_app.modules.cleanup.service import RemoveFilesService
+
         svc = RemoveFilesService(Path(req.root))
 
-        # PLAN or APPLY
-        planned = svc.run(req.patterns, True, req.remove_empty_dirs)
-        typer.echo(f"[PLAN] Would remove {len(planned)} file(s)")
-        for p in planned:
-            typer.echo(str(p))
+        # PLAN: stream matches as the walk finds them, then summarise
+        planned = echo_lines(str(p) for p in svc.iter_run(req.patterns))
+        typer.echo(f"[PLAN] Would remove {planned} file(s)")
 
         # If this was only a plan, offer to apply immediately
         if self.dry_run and planned:
-            if typer.confirm("Apply these removals now?", default=False):
+            if confirm_or_default("Apply these removals now?", default=False):
                 applied = svc.run(req.patterns, False, req.remove_empty_dirs)
                 typer.echo(f"[APPLY] Removed {len(applied)} file(s)")
                 return
@@ -90,19 +94,26 @@ def remove_files_cmd(
         root = prompt_existing_dir(None, "root")
 
     if not pattern:
-        raw = typer.prompt(
+        raw = prompt_or_default(
             "Regex pattern(s) to match files for removal (comma-separated)",
             default=r".*\.(tmp|log|ds_store)$",
         )
         pattern = [p.strip() for p in raw.split(",") if p.strip()]
 
+    # Reject bad regexes up front rather than after the tree has been walked
+    for p in pattern:
+        try:
+            re.compile(p)
+        except re.error as e:
+            raise typer.BadParameter(f"invalid regex {p!r}: {e}") from e
+
     if prune_empty is None:
-        prune_empty = typer.confirm(
+        prune_empty = confirm_or_default(
             "Remove empty directories after deleting files?", default=True
         )
 
     if not apply and not plan:
-        mode = typer.prompt("option (plan/apply)", default="plan").strip().lower()
+        mode = prompt_or_default("option (plan/apply)", default="plan").strip().lower()
         if mode not in {"plan", "apply"}:
             raise typer.BadParameter("option must be 'plan' or 'apply'")
         plan = mode == "plan"
@@ -125,17 +136,17 @@ class RemoveFoldersRunner:
         req = RemoveFoldersRequest(
             root=self.root, folder_names=self.folder_names, dry_run=self.dry_run
         )
+        from vi_app.modules.cleanup.service import RemoveFoldersService
+
         svc = RemoveFoldersService(Path(req.root))
 
-        # PLAN
-        planned = svc.run(req.folder_names, True)
-        typer.echo(f"[PLAN] Would remove {len(planned)} directorie(s)")
-        for p in planned:
-            typer.echo(str(p))
+        # PLAN: stream matches as the walk finds them, then summarise
+        planned = echo_lines(str(p) for p in svc.iter_run(req.folder_names))
+        typer.echo(f"[PLAN] Would remove {planned} directorie(s)")
 
         # Offer to apply
         if self.dry_run and planned:
-            if typer.confirm("Apply these removals now?", default=False):
+            if confirm_or_default("Apply these removals now?", default=False):
                 applied = svc.run(req.folder_names, False)
                 typer.echo(f"[APPLY] Removed {len(applied)} directorie(s)")
                 return
@@ -162,14 +173,14 @@ def remove_folders_cmd(
         root = prompt_existing_dir(None, "root")
 
     if not name:
-        raw = typer.prompt(
+        raw = prompt_or_default(
             "Folder name(s) to remove (comma-separated)",
             default="duplicate",
         )
         name = [n.strip() for n in raw.split(",") if n.strip()] or ["duplicate"]
 
     if not apply and not plan:
-        mode = typer.prompt("option (plan/apply)", default="plan").strip().lower()
+        mode = prompt_or_default("option (plan/apply)", default="plan").strip().lower()
         if mode not in {"plan", "apply"}:
             raise typer.BadParameter("option must be 'plan' or 'apply'")
         plan = mode == "plan"
@@ -183,39 +194,44 @@ def remove_folders_cmd(
 # Rename (IMG_/VID_ sequences)
 # ----------------------
 class RenameRunner:
-    def __init__(self, root: Path, recurse: bool, zero_pad: int, dry_run: bool) -> None:
+    def __init__(
+        self,
+        root: Path,
+        recurse: bool,
+        zero_pad: int,
+        dry_run: bool,
+        parallel: bool | None = None,
+    ) -> None:
         self.root = root
         self.recurse = recurse
         self.zero_pad = zero_pad
         self.dry_run = dry_run
+        self.parallel = parallel  # None -> service decides from the batch size
         self.console = Console()
 
     def _progress(self) -> Progress:
         return Progress(
-            TextColumn("[bold]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TextColumn("•"),
-            TimeRemainingColumn(),
-            TextColumn("• {task.fields[detail]}"),
+            *progress_columns(),
             console=self.console,
+            refresh_per_second=REFRESH_PER_SECOND,
         )
 
     def run(self) -> None:
+        from vi_app.modules.cleanup.service import RenameService
+
         svc = RenameService(
             root=self.root, recurse=self.recurse, zero_pad=self.zero_pad
         )
 
-        # PLAN (gather both images and videos before deciding)
-        with self.console.status("Planning image renames… found 0 files") as status:
+        # PLAN (images and videos together, in a single walk of the tree)
+        with self.console.status("Planning renames… found 0 files") as status:
 
             def _on_discover(n: int) -> None:
-                status.update(status=f"Planning image renames… found {n} files")
+                status.update(status=f"Planning renames… found {n} files")
 
-            img_targets = svc.enumerate_targets(on_discover=_on_discover)
-        vid_targets = svc.enumerate_video_targets(
-            zero_pad=self.zero_pad, on_discover=lambda n: None
-        )
+            img_targets, vid_targets = svc.enumerate_all(
+                video_zero_pad=self.zero_pad, on_discover=_on_discover
+            )
 
         img_total = len(img_targets)
         vid_total = len(vid_targets)
@@ -228,8 +244,7 @@ class RenameRunner:
                 f"[PLAN] images (all formats): {img_total} file(s) will be renamed"
             )
             if self.dry_run:
-                for src, dst in img_targets:
-                    typer.echo(f"{src} -> {dst}")
+                echo_lines(f"{src} -> {dst}" for src, dst in img_targets)
 
         if vid_total == 0:
             self.console.print("No videos to rename.", style="dim")
@@ -238,66 +253,67 @@ class RenameRunner:
                 f"[PLAN] videos (all formats): {vid_total} file(s) will be renamed"
             )
             if self.dry_run:
-                for src, dst in vid_targets:
-                    typer.echo(f"{src} -> {dst}")
+                echo_lines(f"{src} -> {dst}" for src, dst in vid_targets)
+
+        if not (img_total or vid_total):
+            return
 
         # If dry-run, offer to apply both phases now
-        if self.dry_run and (img_total or vid_total):
-            if not typer.confirm("Apply these renames now?", default=False):
+        if self.dry_run:
+            if not confirm_or_default("Apply these renames now?", default=False):
                 return
 
-        # APPLY images (if any)
-        if img_total:
-            bar = self._progress()
-            renamed = skipped = 0
-            failures: list[tuple[Path, Path, str]] = []
-            with bar:
+        # APPLY images, then videos: one Progress (one live display) for both phases
+        failures: list[tuple[Path, Path, str]] = []
+        v_failures: list[tuple[Path, Path, str]] = []
+        bar = self._progress()
+        with bar:
+            if img_total:
                 task = bar.add_task("Renaming images", total=img_total, detail="")
-                for src, dst, ok, reason in svc.iter_apply(targets=img_targets):
-                    bar.update(
-                        task, advance=1, detail=f"{Path(src).name} -> {Path(dst).name}"
-                    )
-                    if ok:
-                        renamed += 1
-                    else:
-                        skipped += 1
-                        failures.append((Path(src), Path(dst), reason or "unknown"))
-            if failures:
-                self.console.print(
-                    "[bold yellow]Skipped/failed image renames:[/bold yellow]"
-                )
-                for src, dst, reason in failures:
-                    self.console.print(
-                        f"{src} -> {dst}  [yellow]SKIP[/yellow] ({reason})"
-                    )
-
-        # APPLY videos (if any)
-        if vid_total:
-            bar_v = self._progress()
-            v_renamed = v_skipped = 0
-            v_failures: list[tuple[Path, Path, str]] = []
-            with bar_v:
-                task_v = bar_v.add_task("Renaming videos", total=vid_total, detail="")
-                for src, dst, ok, reason in svc.iter_apply(targets=vid_targets):
-                    bar_v.update(
-                        task_v,
-                        advance=1,
-                        detail=f"{Path(src).name} -> {Path(dst).name}",
-                    )
-                    if ok:
-                        v_renamed += 1
-                    else:
-                        v_skipped += 1
-                        v_failures.append((Path(src), Path(dst), reason or "unknown"))
-
-            if v_failures:
-                self.console.print(
-                    "[bold yellow]Skipped/failed video renames:[/bold yellow]"
-                )
-                for src, dst, reason in v_failures:
-                    self.console.print(
-                        f"{src} -> {dst}  [yellow]SKIP[/yellow] ({reason})"
-                    )
+                failures = self._apply(svc, img_targets, bar, task)
+            if vid_total:
+                task_v = bar.add_task("Renaming videos", total=vid_total, detail="")
+                v_failures = self._apply(svc, vid_targets, bar, task_v)
+
+        if failures:
+            self.console.print(
+                "[bold yellow]Skipped/failed image renames:[/bold yellow]"
+            )
+            for src, dst, reason in failures:
+                self.console.print(f"{src} -> {dst}  [yellow]SKIP[/yellow] ({reason})")
+        if v_failures:
+            self.console.print(
+                "[bold yellow]Skipped/failed video renames:[/bold yellow]"
+            )
+            for src, dst, reason in v_failures:
+                self.console.print(f"{src} -> {dst}  [yellow]SKIP[/yellow] ({reason})")
+
+    def _apply(
+        self,
+        svc: RenameService,
+        targets: list[tuple[Path, Path]],
+        bar: Progress,
+        task: TaskID,
+    ) -> list[tuple[Path, Path, str]]:
+        """
+        Run the renames and return the failures. Progress goes through a
+        ThrottledTask, so Rich is updated every few dozen ms instead of per file;
+        the result tuple is handed over as-is and only formatted on a flush.
+        """
+        failures: list[tuple[Path, Path, str]] = []
+        throttle = ThrottledTask(bar, task, format_detail=_rename_detail)
+        for result in svc.iter_apply(targets=targets, parallel=self.parallel):
+            src, dst, ok, reason = result
+            if not ok:
+                failures.append((src, dst, reason or "unknown"))
+            throttle.update(1, result)
+        throttle.flush()
+        return failures
+
+
+def _rename_detail(result: tuple[Path, Path, bool, str | None]) -> str:
+    """Progress detail for one iter_apply() result: 'old name -> new name'."""
+    return f"{result[0].name} -> {result[1].name}"
 
 
 @app.command("rename")
@@ -307,6 +323,11 @@ def rename_cmd(
     ),
     recurse: bool | None = typer.Option(None, "--recurse/--no-recurse"),
     zero_pad: int | None = typer.Option(None, "--zero-pad", "-z", min=3, max=10),
+    parallel: bool | None = typer.Option(
+        None,
+        "--parallel/--no-parallel",
+        help="Finalize folders concurrently (default: auto for large batches).",
+    ),
     apply: bool = typer.Option(False, "--apply"),
     plan: bool = typer.Option(False, "--plan"),
 ):
@@ -314,19 +335,19 @@ def rename_cmd(
     if root is None:
         root = prompt_existing_dir(None, "root")
     if recurse is None:
-        recurse = typer.confirm("Process subdirectories?", default=True)
+        recurse = confirm_or_default("Process subdirectories?", default=True)
     if zero_pad is None:
-        zero_pad = typer.prompt(
+        zero_pad = prompt_or_default(
             "Digits in sequence (3-10) for BOTH images and videos", default=6, type=int
         )
     if not apply and not plan:
-        mode = typer.prompt("option (plan/apply)", default="plan").strip().lower()
+        mode = prompt_or_default("option (plan/apply)", default="plan").strip().lower()
         if mode not in {"plan", "apply"}:
             raise typer.BadParameter("option must be 'plan' or 'apply'")
         plan = mode == "plan"
         apply = mode == "apply"
     dry_run = resolve_dry_run(apply, plan)
-    RenameRunner(root, recurse, zero_pad, dry_run).run()
+    RenameRunner(root, recurse, zero_pad, dry_run, parallel=parallel).run()
 
 
 # ----------------------
@@ -340,6 +361,8 @@ class SortRunner:
         strategy: SortStrategy,
         dry_run: bool,
     ) -> None:
+        from vi_app.modules.cleanup.service import SortService
+
         self.src_root = src_root
         self.dst_root = dst_root
         self.strategy = strategy
@@ -365,7 +388,7 @@ class SortRunner:
 
         # Offer to apply
         if planned and (
-            self.dry_run or typer.confirm("Apply these moves now?", default=False)
+            self.dry_run or confirm_or_default("Apply these moves now?", default=False)
         ):
             apply_req = SortRequest(
                 src_root=self.src_root,
@@ -375,7 +398,9 @@ class SortRunner:
             )
             progress2, reporter2 = make_phase_progress(self.console)
             with progress2:
-                applied = self.service.apply(apply_req, reporter=reporter2)
+                applied = self.service.apply(
+                    apply_req, reporter=reporter2, planned=planned
+                )
             typer.echo(f"[APPLY] strategy={self.strategy} moved={len(applied)}")
 
 
@@ -399,7 +424,7 @@ def sort_cmd(
 
     if strategy is None:
         choice = (
-            typer.prompt("strategy (by_date/by_location)", default="by_date")
+            prompt_or_default("strategy (by_date/by_location)", default="by_date")
             .strip()
             .lower()
         )
@@ -408,14 +433,14 @@ def sort_cmd(
         strategy = SortStrategy(choice)
 
     if dst_root is None:
-        same = typer.confirm(
+        same = confirm_or_default(
             "Sort into subfolders under the source root?", default=True
         )
         if not same:
             dst_root = prompt_existing_dir(None, "dst_root")
 
     if not apply and not plan:
-        mode = typer.prompt("option (plan/apply)", default="plan").strip().lower()
+        mode = prompt_or_default("option (plan/apply)", default="plan").strip().lower()
         if mode not in {"plan", "apply"}:
             raise typer.BadParameter("option must be 'plan' or 'apply'")
         plan = mode == "plan"
@@ -1,10 +1,16 @@
 # src\vi_app\commands\common.py
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
 import typer
 
+_ECHO_CHUNK = 1000
+
 
 def resolve_dry_run(apply: bool, plan: bool) -> bool:
     """
@@ -26,3 +32,55 @@ def prompt_existing_dir(maybe_root: Path | None, prompt_label: str = "root") ->
             f"{prompt_label} does not exist or is not a directory: {root}"
         )
     return root
+
+
+def is_interactive() -> bool:
+    """True when stdin is a terminal someone can answer prompts on."""
+    try:
+        return sys.stdin is not None and sys.stdin.isatty()
+    except (AttributeError, ValueError):  # replaced or closed stdin
+        return False
+
+
+def prompt_or_default(text: str, default: Any, **kwargs: Any) -> Any:
+    """
+    typer.prompt, except that once a non-terminal stdin runs out of answers (CI,
+    cron, `< /dev/null`) the default is used instead of aborting. Piped answers
+    are still read; at a real terminal Ctrl-C/Ctrl-D abort as usual.
+    """
+    try:
+        return typer.prompt(text, default=default, **kwargs)
+    except typer.Abort:
+        if is_interactive():
+            raise
+        typer.echo()  # end the unanswered prompt's line
+        return default
+
+
+def confirm_or_default(text: str, default: bool) -> bool:
+    """typer.confirm with the same end-of-input fallback as prompt_or_default."""
+    try:
+        return bool(typer.confirm(text, default=default))
+    except typer.Abort:
+        if is_interactive():
+            raise
+        typer.echo()
+        return default
+
+
+def echo_lines(lines: Iterable[str]) -> int:
+    """
+    Echo lines as they arrive, `_ECHO_CHUNK` per write instead of one write + flush
+    per line. Returns how many lines were written.
+    """
+    it = iter(lines)
+    count = 0
+    while chunk := list(islice(it, _ECHO_CHUNK)):
+        typer.echo("\n".join(chunk))
+        count += len(chunk)
+    return count
+
+
+def per_second(count: int, seconds: float) -> float:
+    """Throughput for run summaries; 0.0 when the timer didn't advance."""
+    return count / seconds if seconds > 0 else 0.0
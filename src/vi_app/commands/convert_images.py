@@ -3,14 +3,23 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from vi_app.commands.common import resolve_dry_run
+from vi_app.commands.common import (
+    confirm_or_default,
+    echo_lines,
+    per_second,
+    prompt_or_default,
+    resolve_dry_run,
+)
 from vi_app.core.rich_progress import make_phase_progress
-from vi_app.modules.convert.service import ConvertService
+
+if TYPE_CHECKING:
+    from vi_app.modules.convert.service import ConvertService
 
 app = typer.Typer(help="Convert images to JPEG")
 
@@ -27,6 +36,7 @@ class _ConvertRunner:
         flatten_alpha: bool,
         only_exts: set[str] | None,
         dry_run: bool,
+        workers: int | None = None,
     ) -> None:
         self.src_root = src_root
         self.dst_root = dst_root
@@ -36,9 +46,13 @@ class _ConvertRunner:
         self.flatten_alpha = flatten_alpha
         self.only_exts = only_exts
         self.dry_run = dry_run
+        self.workers = workers
         self.console = Console()
 
-    def _build_service(self) -> ConvertService:
+    def _build_service(self, dry_run: bool) -> ConvertService:
+        # Deferred: pulls in Pillow (+ HEIF plugin), which `--help` never needs
+        from vi_app.modules.convert.service import ConvertService
+
         return ConvertService(
             src_root=self.src_root,
             dst_root=self.dst_root,
@@ -47,11 +61,12 @@ class _ConvertRunner:
             overwrite=self.overwrite,
             flatten_alpha=self.flatten_alpha,
             only_exts=self.only_exts,
-            dry_run=self.dry_run,
+            dry_run=dry_run,
+            workers=self.workers,
         )
 
     def run(self) -> None:
-        svc = self._build_service()
+        svc = self._build_service(self.dry_run)
 
         # Always plan first for "apply now?" UX
         progress, reporter = make_phase_progress(self.console)
@@ -63,12 +78,11 @@ class _ConvertRunner:
             return
 
         # Show the plan
-        for src, dst in pairs:
-            typer.echo(f"{src} -> {dst}")
+        echo_lines(f"{src} -> {dst}" for src, dst in pairs)
         typer.echo(f"[PLAN] Would convert {total} file(s).")
 
         # If user requested plan, offer to apply now
-        do_apply = (not self.dry_run) or typer.confirm(
+        do_apply = (not self.dry_run) or confirm_or_default(
             "Apply these conversions now?", default=False
         )
         if not do_apply:
@@ -77,26 +91,25 @@ class _ConvertRunner:
         # APPLY (with progress)
         # Ensure service is set to non-dry-run if originally planned
         if self.dry_run:
-            svc = ConvertService(
-                src_root=self.src_root,
-                dst_root=self.dst_root,
-                recurse=self.recurse,
-                quality=self.quality,
-                overwrite=self.overwrite,
-                flatten_alpha=self.flatten_alpha,
-                only_exts=self.only_exts,
-                dry_run=False,
+            svc = self._build_service(dry_run=False)
+
+        from PIL import features
+
+        if not features.check_feature("libjpeg_turbo"):
+            self.console.print(
+                "Pillow is not linked against libjpeg-turbo; encoding will be slower.",
+                style="dim",
             )
 
         progress2, reporter2 = make_phase_progress(self.console)
         t0 = time.perf_counter()
         with progress2:
-            results = svc.apply(reporter=reporter2)
+            results = svc.apply(reporter=reporter2, targets=pairs)
 
         converted = sum(1 for _s, _d, ok, _r in results if ok)
         skipped = total - converted
         elapsed = time.perf_counter() - t0
-        rate = total / elapsed if elapsed > 0 else 0.0
+        rate = per_second(total, elapsed)
 
         # Print skipped table if any
         skipped_rows = [(s, r) for s, d, ok, r in results if not ok]
@@ -114,6 +127,69 @@ class _ConvertRunner:
         )
 
 
+def _prompt_common(
+    src_root: Path | None,
+    dst_root: Path | None,
+    quality: int | None,
+    overwrite: bool | None,
+    recurse: bool | None,
+    flatten_alpha: bool | None,
+    apply: bool,
+    plan: bool,
+) -> tuple[Path, Path | None, int, bool, bool, bool, bool]:
+    """
+    Shared option handling for the image commands: prompt for whatever wasn't given
+    on the command line and return
+    (src_root, dst_root, quality, overwrite, recurse, flatten_alpha, dry_run).
+    """
+    if src_root is None:
+        src_root = Path(typer.prompt("src (folder to scan)")).expanduser()
+    if not src_root.exists() or not src_root.is_dir():
+        raise typer.BadParameter(
+            f"src_root does not exist or is not a directory: {src_root}"
+        )
+
+    if dst_root is None:
+        dst_str = prompt_or_default(
+            "dst (destination root; Enter = default '<src>/converted')", default=""
+        )
+        dst_root = Path(dst_str).expanduser() if dst_str else None
+
+    if quality is None:
+        quality = prompt_or_default("quality (1-100)", default=100, type=int)
+        if not (1 <= quality <= 100):
+            raise typer.BadParameter("quality must be 1..100")
+
+    if overwrite is None:
+        overwrite = confirm_or_default(
+            "overwrite destination files if they already exist?", default=False
+        )
+
+    if recurse is None:
+        recurse = confirm_or_default("recurse into subfolders?", default=True)
+
+    if flatten_alpha is None:
+        flatten_alpha = confirm_or_default(
+            "flatten alpha (composite transparency to white)?", default=True
+        )
+
+    if not apply and not plan:
+        mode = prompt_or_default("option (plan/apply)", default="plan").strip().lower()
+        if mode not in {"plan", "apply"}:
+            raise typer.BadParameter("option must be 'plan' or 'apply'")
+        plan, apply = (mode == "plan"), (mode == "apply")
+
+    return (
+        src_root,
+        dst_root,
+        quality,
+        overwrite,
+        recurse,
+        flatten_alpha,
+        resolve_dry_run(apply, plan),
+    )
+
+
 def register(app: typer.Typer) -> None:
     """Attach image conversion commands to the given Typer app."""
 
@@ -141,48 +217,28 @@ def register(app: typer.Typer) -> None:
             "--flatten-alpha/--no-flatten-alpha",
             help="Composite transparency to white.",
         ),
+        workers: int | None = typer.Option(
+            None,
+            "--workers",
+            "-w",
+            min=1,
+            help="Parallel conversions (default: auto from CPU count).",
+        ),
         apply: bool = typer.Option(False, "--apply", help="Perform writes."),
         plan: bool = typer.Option(False, "--plan", help="Plan only (default)."),
     ):
-        # Interactive prompts
-        if src_root is None:
-            src_root = Path(typer.prompt("src (folder to scan)")).expanduser()
-        if not src_root.exists() or not src_root.is_dir():
-            raise typer.BadParameter(
-                f"src_root does not exist or is not a directory: {src_root}"
-            )
-
-        if dst_root is None:
-            dst_str = typer.prompt(
-                "dst (destination root; Enter = default '<src>/converted')", default=""
+        src_root, dst_root, quality, overwrite, recurse, flatten_alpha, dry_run = (
+            _prompt_common(
+                src_root,
+                dst_root,
+                quality,
+                overwrite,
+                recurse,
+                flatten_alpha,
+                apply,
+                plan,
             )
-            dst_root = Path(dst_str).expanduser() if dst_str else None
-
-        if quality is None:
-            quality = typer.prompt("quality (1-100)", default=100, type=int)
-            if not (1 <= quality <= 100):
-                raise typer.BadParameter("quality must be 1..100")
-
-        if overwrite is None:
-            overwrite = typer.confirm(
-                "overwrite destination files if they already exist?", default=False
-            )
-
-        if recurse is None:
-            recurse = typer.confirm("recurse into subfolders?", default=True)
-
-        if flatten_alpha is None:
-            flatten_alpha = typer.confirm(
-                "flatten alpha (composite transparency to white)?", default=True
-            )
-
-        if not apply and not plan:
-            mode = typer.prompt("option (plan/apply)", default="plan").strip().lower()
-            if mode not in {"plan", "apply"}:
-                raise typer.BadParameter("option must be 'plan' or 'apply'")
-            plan, apply = (mode == "plan"), (mode == "apply")
-
-        dry_run = resolve_dry_run(apply, plan)
+        )
         _ConvertRunner(
             src_root=src_root,
             dst_root=dst_root,
@@ -192,6 +248,7 @@ def register(app: typer.Typer) -> None:
             flatten_alpha=flatten_alpha,
             only_exts=None,
             dry_run=dry_run,
+            workers=workers,
         ).run()
 
     @app.command(
@@ -215,44 +272,22 @@ def register(app: typer.Typer) -> None:
             "--flatten-alpha/--no-flatten-alpha",
             help="Composite transparency to white.",
         ),
+        workers: int | None = typer.Option(
+            None,
+            "--workers",
+            "-w",
+            min=1,
+            help="Parallel conversions (default: auto from CPU count).",
+        ),
         apply: bool = typer.Option(False, "--apply", help="Perform writes."),
         plan: bool = typer.Option(False, "--plan", help="Plan only (default)."),
     ):
-        if src_root is None:
-            src_root = Path(typer.prompt("src (folder to scan)")).expanduser()
-        if not src_root.exists() or not src_root.is_dir():
-            raise typer.BadParameter(
-                f"src_root does not exist or is not a directory: {src_root}"
+        # recurse=True: webp-to-jpeg always walks the whole tree, so never asks
+        src_root, dst_root, quality, overwrite, _, flatten_alpha, dry_run = (
+            _prompt_common(
+                src_root, dst_root, quality, overwrite, True, flatten_alpha, apply, plan
             )
-
-        if dst_root is None:
-            dst_str = typer.prompt(
-                "dst (destination root; Enter = default '<src>/converted')", default=""
-            )
-            dst_root = Path(dst_str).expanduser() if dst_str else None
-
-        if quality is None:
-            quality = typer.prompt("quality (1-100)", default=100, type=int)
-            if not (1 <= quality <= 100):
-                raise typer.BadParameter("quality must be 1..100")
-
-        if overwrite is None:
-            overwrite = typer.confirm(
-                "overwrite destination files if they already exist?", default=False
-            )
-
-        if flatten_alpha is None:
-            flatten_alpha = typer.confirm(
-                "flatten alpha (composite transparency to white)?", default=True
-            )
-
-        if not apply and not plan:
-            mode = typer.prompt("option (plan/apply)", default="plan").strip().lower()
-            if mode not in {"plan", "apply"}:
-                raise typer.BadParameter("option must be 'plan' or 'apply'")
-            plan, apply = (mode == "plan"), (mode == "apply")
-
-        dry_run = resolve_dry_run(apply, plan)
+        )
         _ConvertRunner(
             src_root=src_root,
             dst_root=dst_root,
@@ -262,4 +297,5 @@ def register(app: typer.Typer) -> None:
             flatten_alpha=flatten_alpha,
             only_exts={".webp"},  # restrict to webp
             dry_run=dry_run,
+            workers=workers,
         ).run()
@@ -8,14 +8,23 @@ import subprocess
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from vi_app.commands.common import resolve_dry_run
+from vi_app.commands.common import (
+    confirm_or_default,
+    echo_lines,
+    per_second,
+    prompt_or_default,
+    resolve_dry_run,
+)
 from vi_app.core.rich_progress import make_phase_progress
-from vi_app.modules.convert.service import Mp4ConvertService
+
+if TYPE_CHECKING:
+    from vi_app.modules.convert.service import Mp4ConvertService
 
 
 class _Mp4Runner:
@@ -41,6 +50,9 @@ class _Mp4Runner:
         self.console = Console()
 
     def _build_service(self, dry_run: bool) -> Mp4ConvertService:
+        # Deferred: the convert module pulls in Pillow, which `--help` never needs
+        from vi_app.modules.convert.service import Mp4ConvertService
+
         return Mp4ConvertService(
             src_root=self.src_root,
             dst_root=self.dst_root,
@@ -64,11 +76,10 @@ class _Mp4Runner:
                 typer.echo("No convertible videos found.")
                 return
 
-            for src, dst in pairs:
-                typer.echo(f"{src} -> {dst}")
+            echo_lines(f"{src} -> {dst}" for src, dst in pairs)
             typer.echo(f"[PLAN] Would convert {total} file(s).")
 
-            if not typer.confirm("Apply these conversions now?", default=False):
+            if not confirm_or_default("Apply these conversions now?", default=False):
                 return
 
             # fallthrough to apply
@@ -76,7 +87,7 @@ class _Mp4Runner:
             progress2, reporter2 = make_phase_progress(self.console)
             t0 = time.perf_counter()
             with progress2:
-                results = svc_apply.apply(reporter=reporter2)
+                results = svc_apply.apply(reporter=reporter2, targets=pairs)
             total = len(results)  # compute from actual apply
         else:
             # APPLY path: no plan printed, go straight to apply
@@ -90,7 +101,7 @@ class _Mp4Runner:
         converted = sum(1 for _s, _d, ok, _r in results if ok)
         skipped = total - converted
         elapsed = time.perf_counter() - t0
-        rate = total / elapsed if elapsed > 0 else 0.0
+        rate = per_second(total, elapsed)
 
         skipped_rows = [(s, r) for s, _d, ok, r in results if not ok]
         if skipped_rows:
@@ -152,22 +163,22 @@ def register(app: typer.Typer) -> None:
             )
 
         if dst_root is None:
-            dst_str = typer.prompt(
+            dst_str = prompt_or_default(
                 "dst (destination root; press Enter to use default '<src>/converted')",
                 default="",
             )
             dst_root = Path(dst_str).expanduser() if dst_str else None
 
         if recurse is None:
-            recurse = typer.confirm("recurse into subfolders?", default=True)
+            recurse = confirm_or_default("recurse into subfolders?", default=True)
         if overwrite is None:
-            overwrite = typer.confirm(
+            overwrite = confirm_or_default(
                 "overwrite destination files if they already exist?", default=False
             )
 
         # CRF: default to lossless (0)
         if crf is None:
-            crf = typer.prompt(
+            crf = prompt_or_default(
                 "CRF (0–51, lower = higher quality; 0 = lossless)", default=0, type=int
             )
             if not (0 <= crf <= 51):
@@ -187,7 +198,7 @@ def register(app: typer.Typer) -> None:
         }
         if preset is None:
             preset = (
-                typer.prompt(
+                prompt_or_default(
                     f"x264 preset ({', '.join(sorted(valid))})",
                     default="ultrafast",
                 )
@@ -203,7 +214,7 @@ def register(app: typer.Typer) -> None:
         bitrate_opts = ["96k", "128k", "160k", "192k", "256k", "320k"]
         if audio_bitrate is None:
             audio_bitrate = (
-                typer.prompt(
+                prompt_or_default(
                     f"audio bitrate ({', '.join(bitrate_opts)})",
                     default="320k",
                 )
@@ -216,7 +227,9 @@ def register(app: typer.Typer) -> None:
             )
 
         if not apply and not plan:
-            mode = typer.prompt("option (plan/apply)", default="plan").strip().lower()
+            mode = (
+                prompt_or_default("option (plan/apply)", default="plan").strip().lower()
+            )
             if mode not in {"plan", "apply"}:
                 raise typer.BadParameter("option must be 'plan' or 'apply'")
             plan, apply = (mode == "plan"), (mode == "apply")
@@ -448,7 +461,7 @@ def register(app: typer.Typer) -> None:
     ):
         # Ask whether to autogen if not provided explicitly
         if autogen is None:
-            autogen = typer.confirm("Use auto-generated test clips?", default=True)
+            autogen = confirm_or_default("Use auto-generated test clips?", default=True)
 
         # Determine CPU thread count
         cpu_threads = max(1, os.cpu_count() or 1)
@@ -487,6 +500,8 @@ def register(app: typer.Typer) -> None:
                     f"src_root does not exist or is not a directory: {src_root}"
                 )
 
+        from vi_app.modules.convert.service import Mp4ConvertService
+
         # Discover available pairs (plan)
         discover = Mp4ConvertService(
             src_root=src_root,
@@ -679,7 +694,7 @@ def register(app: typer.Typer) -> None:
                 else:
                     sec, res = _run_mixed(cpu_w, gpu_w)
                 ok = sum(1 for _s, _d, o, _r in res if o)
-                fps = ok / sec if sec > 0 else 0.0
+                fps = per_second(ok, sec)
                 rows.append((mode, cpu_w, gpu_w, ok, sec, fps))
                 console.print(
                     f"[bold]bench[/bold] mode={mode} cpu={cpu_w} gpu={gpu_w} -> {ok} files in {sec:.2f}s ({fps:.2f} files/s)"
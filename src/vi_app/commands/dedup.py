@@ -4,15 +4,23 @@ from __future__ import annotations
 import time
 from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from vi_app.commands.common import prompt_existing_dir, resolve_dry_run
+from vi_app.commands.common import (
+    confirm_or_default,
+    prompt_existing_dir,
+    prompt_or_default,
+    resolve_dry_run,
+)
 from vi_app.core.rich_progress import make_phase_progress
 from vi_app.modules.dedup.schemas import DedupRequest, DedupStrategy
-from vi_app.modules.dedup.service import DedupService
+
+if TYPE_CHECKING:
+    from vi_app.modules.dedup.service import DedupService
 
 __all__ = ["app"]
 
@@ -24,12 +32,15 @@ class DedupInteractiveRunner:
 
     def __init__(self) -> None:
         self.console = Console()
-        self.service = DedupService()
+        # Deferred: the strategies pull in Pillow, which `--help` never needs
+        from vi_app.modules.dedup.service import DedupService
+
+        self.service: DedupService = DedupService()
 
     # -------- prompts --------
     def _prompt_strategy(self) -> DedupStrategy:
         choice = (
-            typer.prompt("strategy (content/metadata)", default="content")
+            prompt_or_default("strategy (content/metadata)", default="content")
             .strip()
             .lower()
         )
@@ -38,13 +49,13 @@ class DedupInteractiveRunner:
         return DedupStrategy(choice)
 
     def _prompt_mode(self) -> tuple[bool, bool]:
-        mode = typer.prompt("option (plan/apply)", default="plan").strip().lower()
+        mode = prompt_or_default("option (plan/apply)", default="plan").strip().lower()
         if mode not in {"plan", "apply"}:
             raise typer.BadParameter("option must be 'plan' or 'apply'")
         return (mode == "apply", mode == "plan")
 
     def _prompt_move_to(self) -> Path | None:
-        mv = typer.prompt(
+        mv = prompt_or_default(
             "move-to (destination for duplicates; Enter = sibling 'duplicate/' folder)",
             default="",
         ).strip()
@@ -78,7 +89,7 @@ class DedupInteractiveRunner:
         apply, plan = self._prompt_mode()
         dry_run = resolve_dry_run(apply, plan)
         move_to = self._prompt_move_to() if apply else None
-        show_table = typer.confirm("Show duplicate clusters table?", default=False)
+        show_table = confirm_or_default("Show duplicate clusters table?", default=False)
 
         # 2) Build request
         req = DedupRequest(
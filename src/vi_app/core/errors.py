@@ -1,7 +1,10 @@
 # src/vi_app/core/errors.py
 from __future__ import annotations
 
-from fastapi import HTTPException, status
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastapi import HTTPException
 
 
 class ViAppError(Exception):
@@ -22,6 +25,9 @@ def to_http(exc: Exception) -> HTTPException:
     """
     Convert our exceptions to HTTPException with sensible defaults.
     """
+    # Imported here so the CLI, which only raises these, doesn't load FastAPI
+    from fastapi import HTTPException, status
+
     if isinstance(exc, BadRequest):
         return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
     if isinstance(exc, NotFound):
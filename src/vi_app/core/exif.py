@@ -0,0 +1,149 @@
+# src/vi_app/core/exif.py
+from __future__ import annotations
+
+import os
+import struct
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+from PIL import Image
+
+JPEG_EXTS: set[str] = {".jpg", ".jpeg", ".jpe", ".jfif"}
+
+_EXIF_HEADER = b"Exif\x00\x00"
+_APP1 = 0xE1
+_SOS = 0xDA
+_EOI = 0xD9
+# Markers that stand alone (no length field): TEM and RST0..RST7
+_STANDALONE = {0x01, *range(0xD0, 0xD8)}
+
+_EXIF_IFD = 0x8769
+# DateTimeOriginal, DateTimeDigitized (Exif sub-IFD), then DateTime (IFD0)
+_DATE_TAGS = ((_EXIF_IFD, 36867), (_EXIF_IFD, 36868), (None, 306))
+_DATE_FORMATS = ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y:%m:%d %H:%M:%S%z")
+
+
+def read_jpeg_exif(path: Path) -> Image.Exif | None:
+    """
+    Parse EXIF from a JPEG by walking its marker segments up to the APP1/Exif
+    payload; pixel data and the rest of the file are never read.
+
+    Returns an empty Exif when the JPEG has no EXIF, and None when the file is not
+    a (well-formed) JPEG so callers can fall back to Image.open.
+    """
+    try:
+        with open(path, "rb") as f:
+            if f.read(2) != b"\xff\xd8":
+                return None
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                code = marker[1]
+                if code == 0xFF:  # fill byte before the real marker
+                    f.seek(-1, 1)
+                    continue
+                if code in (_SOS, _EOI):  # EXIF always precedes the scan
+                    return Image.Exif()
+                if code in _STANDALONE:
+                    continue
+                head = f.read(2)
+                if len(head) < 2:
+                    return None
+                (length,) = struct.unpack(">H", head)
+                if length < 2:  # the length counts its own two bytes
+                    return None
+                if code == _APP1:
+                    payload = f.read(length - 2)
+                    if payload.startswith(_EXIF_HEADER):
+                        exif = Image.Exif()
+                        exif.load(payload)
+                        return exif
+                    continue  # e.g. an XMP APP1; keep looking
+                f.seek(length - 2, 1)
+    except (OSError, struct.error, SyntaxError, ValueError):
+        return None
+
+
+def load_exif(path: Path) -> Image.Exif:
+    """
+    EXIF for any image: JPEGs go through read_jpeg_exif, everything else (and
+    malformed JPEGs) through Image.open, which only parses the header.
+    Raises like Image.open when the file can't be read as an image.
+    """
+    if path.suffix.lower() in JPEG_EXTS:
+        exif = read_jpeg_exif(path)
+        if exif is not None:
+            return exif
+    with Image.open(path) as im:
+        return im.getexif()
+
+
+def parse_exif_datetime(value: str | bytes) -> datetime | None:
+    """Parse an EXIF timestamp ('YYYY:MM:DD HH:MM:SS' and common variants)."""
+    if isinstance(value, bytes):
+        value = value.decode(errors="ignore")
+    value = value.strip("\x00 ")
+    if len(value) == 19 and value[10] == " ":
+        # Canonical 'YYYY:MM:DD HH:MM:SS' (or '-' dates): slice the fixed fields
+        # instead of strptime, which re-resolves the format on every call
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+            )
+        except ValueError:
+            pass  # e.g. '0000:00:00 00:00:00' placeholders; try the formats below
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    # Lenient: fractional seconds, '/' or '-' date separators
+    day, _, clock = value.split(".")[0].partition(" ")
+    day = day.replace(":", "-").replace("/", "-")
+    try:
+        return datetime.fromisoformat(f"{day} {clock}" if clock else day)
+    except ValueError:
+        return None
+
+
+def exif_datetime(exif: Image.Exif) -> datetime | None:
+    """First parseable of DateTimeOriginal, DateTimeDigitized and DateTime."""
+    if not exif:
+        return None
+    sub = exif.get_ifd(_EXIF_IFD)
+    for ifd, tag in _DATE_TAGS:
+        v = (sub if ifd else exif).get(tag)
+        if isinstance(v, str | bytes) and v:
+            dt = parse_exif_datetime(v)
+            if dt:
+                return dt
+    return None
+
+
+def read_datetime_taken(path: Path, mtime_ns: int | None = None) -> datetime | None:
+    """
+    EXIF capture time of `path`, or None when it has none or can't be read.
+    Results are memoised per (path, mtime_ns), so plan/apply passes and repeat API
+    calls over the same tree parse each header once; touching a file invalidates it.
+    """
+    try:
+        if mtime_ns is None:
+            mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _cached_datetime_taken(os.fspath(path), mtime_ns)
+
+
+@lru_cache(maxsize=65536)
+def _cached_datetime_taken(path: str, mtime_ns: int) -> datetime | None:
+    try:
+        return exif_datetime(load_exif(Path(path)))
+    except Exception:
+        return None
@@ -0,0 +1,113 @@
+# src/vi_app/core/hash_cache.py
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+_ENV_VAR = "VI_HASH_CACHE"
+_DISABLED = {"", "0", "off", "false", "no"}
+_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path     TEXT    NOT NULL,
+    kind     TEXT    NOT NULL,
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    value    TEXT    NOT NULL,
+    pixels   INTEGER NOT NULL,
+    PRIMARY KEY (path, kind)
+)
+"""
+
+
+def default_cache_path() -> Path:
+    """Per-user cache location (LOCALAPPDATA on Windows, XDG_CACHE_HOME elsewhere)."""
+    base = os.getenv("LOCALAPPDATA") or os.getenv("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "vi_app" / "hashes.sqlite3"
+
+
+class HashCache:
+    """
+    Persistent (path, kind) -> (value, pixels) store for per-file hashes.
+    A row is only returned while the file's size and mtime_ns still match, so edited
+    files are re-hashed and unchanged ones are never re-opened on repeat runs.
+    Keys are absolute, case-normalised paths, so a file maps to the same row
+    whatever the working directory. Not thread-safe: use from the thread that
+    opened it.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._pending = 0
+
+    @classmethod
+    def open_default(cls) -> HashCache | None:
+        """
+        Open the cache at `VI_HASH_CACHE` (or the per-user default).
+        Returns None when disabled (`VI_HASH_CACHE=off`) or the database can't be opened.
+        """
+        override = os.getenv(_ENV_VAR)
+        if override is not None and override.strip().lower() in _DISABLED:
+            return None
+        try:
+            return cls(
+                Path(override).expanduser() if override else default_cache_path()
+            )
+        except (OSError, sqlite3.Error):
+            return None
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        # String-only normalisation: no per-file syscall, unlike Path.resolve()
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(
+        self, path: Path, kind: str, size: int, mtime_ns: int
+    ) -> tuple[str, int] | None:
+        try:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, value, pixels FROM hashes"
+                " WHERE path = ? AND kind = ?",
+                (self._key(path), kind),
+            ).fetchone()
+        except sqlite3.Error:  # e.g. locked by a concurrent run; just recompute
+            return None
+        if row is None or row[0] != size or row[1] != mtime_ns:
+            return None
+        return row[2], row[3]
+
+    def put(
+        self, path: Path, kind: str, size: int, mtime_ns: int, value: str, pixels: int
+    ) -> None:
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)",
+                (self._key(path), kind, size, mtime_ns, value, pixels),
+            )
+            self._pending += 1
+            if self._pending >= _BATCH:
+                self._conn.commit()
+                self._pending = 0
+        except sqlite3.Error:
+            pass  # the cache is an optimisation; never fail the run over it
+
+    def close(self) -> None:
+        try:
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
+        finally:
+            self._conn.close()
+
+    def __enter__(self) -> HashCache:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
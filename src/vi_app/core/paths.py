@@ -1,7 +1,12 @@
 # src/vi_app/core/paths.py
 from __future__ import annotations
 
+import errno
+import os
 import re
+import shutil
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 SAFE_NAME_RE = re.compile(r"[^\w\-. ]+", re.UNICODE)
@@ -28,18 +33,126 @@ def ensure_within_root(candidate: Path, root: Path) -> Path:
     return candidate
 
 
-def mirrored_output_path(
-    src: Path, src_root: Path, dst_root: Path, new_name: str | None = None
-) -> Path:
+def mirrored_output_str(src: str, src_root: str, dst_root: str, new_name: str) -> str:
     """
-    Build a destination path that mirrors src's relative structure under a new root.
-    Optionally replace the filename with `new_name`.
+    Build the destination that mirrors src's relative folder under `dst_root`,
+    named `new_name`. Meant for paths yielded by scan_files(src_root): `src` is
+    already known to sit under `src_root`, so there is nothing to resolve
+    or validate, and no PurePath objects are built per file.
     """
-    src = src.resolve()
-    src_root = src_root.resolve()
-    dst_root = dst_root.resolve()
-    ensure_within_root(src, src_root)
-    rel = src.relative_to(src_root)
-    if new_name:
-        rel = rel.with_name(new_name)
-    return (dst_root / rel).resolve()
+    cut = len(src_root.rstrip(os.sep)) + 1
+    return os.path.join(dst_root, os.path.dirname(src)[cut:], new_name)
+
+
+def move_file(src: Path, dst: Path, overwrite: bool = True) -> None:
+    """
+    Move `src` to `dst` with a single rename syscall (atomic on one volume).
+    Only falls back to shutil.move's copy + unlink across filesystems (EXDEV).
+    With `overwrite` an existing `dst` is replaced (os.replace); without it the
+    move uses os.rename, which refuses an existing `dst` on Windows in case a
+    file appears after the caller picked a free name.
+    """
+    try:
+        if overwrite:
+            os.replace(src, dst)
+        else:
+            os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(os.fspath(src), os.fspath(dst))
+
+
+def scan_files(
+    root: Path,
+    recurse: bool = True,
+    exts: set[str] | None = None,
+    workers: int = 1,
+    stat: bool = False,
+    exclude: set[str] | None = None,
+) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield a DirEntry for every file under `root` using os.scandir.
+    Entries carry the directory listing's file type (no stat per is_file()) and cache
+    their stat(), so callers can read sizes without another syscall per path.
+    Symlinked directories are not followed; unreadable directories are skipped.
+
+    exts: only yield files with one of these (lowercase) extensions.
+    workers > 1 lists directories concurrently (yield order is then unspecified);
+    stat=True fills each yielded entry's stat cache on the listing thread.
+    exclude: directory paths (as os.fspath(root)-joined strings) that are pruned
+    whole, e.g. an output folder nested inside the tree being scanned.
+    """
+    if workers > 1 and recurse:
+        yield from _scan_files_parallel(os.fspath(root), exts, workers, stat, exclude)
+        return
+    stack = [os.fspath(root)]
+    while stack:
+        files, subdirs = _scan_dir(stack.pop(), exts, stat, exclude)
+        yield from files
+        if recurse:
+            stack.extend(subdirs)
+
+
+def scan_dirs(root: Path) -> Iterator[str]:
+    """
+    Yield the path of every directory below `root` (root itself excluded), parents
+    before children. Like scan_files, symlinked directories are not followed.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        _, subdirs = _scan_dir(stack.pop(), set(), False)  # exts=set(): dirs only
+        yield from subdirs
+        stack.extend(subdirs)
+
+
+def _scan_dir(
+    path: str, exts: set[str] | None, stat: bool, exclude: set[str] | None = None
+) -> tuple[list[os.DirEntry[str]], list[str]]:
+    files: list[os.DirEntry[str]] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not exclude or entry.path not in exclude:
+                            subdirs.append(entry.path)
+                        continue
+                    if exts is not None:
+                        # Extension first: a plain slice, so non-matching names never
+                        # reach is_file() (a stat for symlinks / unknown d_type)
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot <= 0 or name[dot:].lower() not in exts:
+                            continue
+                    if entry.is_file():
+                        if stat:
+                            entry.stat()
+                        files.append(entry)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def _scan_files_parallel(
+    root: str,
+    exts: set[str] | None,
+    workers: int,
+    stat: bool,
+    exclude: set[str] | None = None,
+) -> Iterator[os.DirEntry[str]]:
+    # scandir/stat release the GIL, so directory listings overlap across threads.
+    # Workers only list; this thread schedules subdirectories and yields the files.
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        pending = {ex.submit(_scan_dir, root, exts, stat, exclude)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                files, subdirs = fut.result()
+                pending.update(
+                    ex.submit(_scan_dir, d, exts, stat, exclude) for d in subdirs
+                )
+                yield from files
@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import Literal, Protocol, runtime_checkable
 
 # Phases the strategies/service may report
-Phase = Literal["scan", "hash", "bucket", "cluster", "select", "move"]
+Phase = Literal["scan", "prefilter", "hash", "bucket", "cluster", "select", "move"]
 
 
 @runtime_checkable
@@ -1,27 +1,96 @@
 # src\vi_app\core\rich_progress.py
 from __future__ import annotations
 
+import time
+from collections.abc import Callable
+from typing import Any
+
 from rich.console import Console
 from rich.progress import (
     BarColumn,
     Progress,
+    ProgressColumn,
+    Task,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
     TimeRemainingColumn,
 )
+from rich.text import Text
 
 from vi_app.core.progress import Phase, ProgressReporter
 
 
+class ThrottledTask:
+    """
+    Coalesces per-item advances and detail text for one Rich task and forwards
+    them at most every `min_interval` seconds, so fast loops aren't bottlenecked
+    on Rich's lock and task bookkeeping. flush() pushes whatever is pending.
+    With `format_detail`, update() takes the raw item and it is only formatted
+    into text when a flush happens.
+    """
+
+    __slots__ = (
+        "progress",
+        "task_id",
+        "min_interval",
+        "format_detail",
+        "_advance",
+        "_detail",
+        "_last",
+    )
+
+    def __init__(
+        self,
+        progress: Progress,
+        task_id: TaskID,
+        min_interval: float = 0.05,
+        format_detail: Callable[[Any], str] | None = None,
+    ) -> None:
+        self.progress = progress
+        self.task_id = task_id
+        self.min_interval = min_interval
+        self.format_detail = format_detail
+        self._advance = 0
+        self._detail: object | None = None
+        self._last = time.monotonic()
+
+    def update(self, advance: int = 1, text: object | None = None) -> None:
+        self._advance += advance
+        if text is not None:
+            self._detail = text
+        now = time.monotonic()
+        if now - self._last >= self.min_interval:
+            self._last = now
+            self.flush()
+
+    def flush(self) -> None:
+        detail = self._detail
+        if detail is None:
+            self.progress.update(self.task_id, advance=self._advance)
+        else:
+            if self.format_detail is not None:
+                detail = self.format_detail(detail)
+            self.progress.update(self.task_id, advance=self._advance, detail=detail)
+        self._advance, self._detail = 0, None
+
+
 class RichPhaseProgressReporter(ProgressReporter):
-    """Reusable Rich bridge that maps service 'phases' to Rich tasks."""
+    """
+    Reusable Rich bridge that maps service 'phases' to Rich tasks.
+    Per-file update() calls go through a ThrottledTask per phase; end() flushes
+    whatever is still pending.
+    """
 
-    def __init__(self, progress: Progress) -> None:
+    def __init__(self, progress: Progress, min_interval: float = 0.05) -> None:
         self.progress = progress
-        self.tasks: dict[str, int] = {}
+        self.min_interval = min_interval
+        self.tasks: dict[str, TaskID] = {}
         self.totals: dict[str, int | None] = {}
+        self._pending: dict[str, ThrottledTask] = {}
         self.labels = {
             "scan": "Scanning",
+            "prefilter": "Prefiltering",
             "hash": "Hashing",
             "bucket": "Bucketing",
             "cluster": "Clustering",
@@ -36,20 +105,22 @@ class RichPhaseProgressReporter(ProgressReporter):
         task_id = self.progress.add_task(label, total=total, detail=(text or ""))
         self.tasks[str(phase)] = task_id
         self.totals[str(phase)] = total
+        self._pending[str(phase)] = ThrottledTask(
+            self.progress, task_id, self.min_interval
+        )
 
     def update(self, phase: Phase, advance: int = 1, text: str | None = None) -> None:
-        task_id = self.tasks.get(str(phase))
-        if task_id is None:
-            return
-        kwargs = {"advance": advance}
-        if text is not None:
-            kwargs["detail"] = text
-        self.progress.update(task_id, **kwargs)
+        pending = self._pending.get(str(phase))
+        if pending is not None:
+            pending.update(advance, text)
 
     def end(self, phase: Phase) -> None:
         task_id = self.tasks.get(str(phase))
         if task_id is None:
             return
+        pending = self._pending.pop(str(phase), None)
+        if pending is not None:
+            pending.flush()
         total = self.totals.get(str(phase))
         if total is None:
             self.progress.update(task_id, visible=False, detail="")
@@ -57,15 +128,41 @@ class RichPhaseProgressReporter(ProgressReporter):
             self.progress.update(task_id, completed=total, detail="")
 
 
-def make_phase_progress(console: Console) -> tuple[Progress, RichPhaseProgressReporter]:
-    """Standardized Rich progress layout + reporter instance."""
-    progress = Progress(
-        TextColumn("[bold]{task.description}"),
+# Redraws per second for every Progress built here (Rich's default is 10);
+# updates are already coalesced, so a slightly slower redraw loses nothing visible
+REFRESH_PER_SECOND = 8
+
+
+class _SeparatorColumn(ProgressColumn):
+    """A constant glyph, built once rather than re-parsed as markup every refresh."""
+
+    def __init__(self, glyph: str = "•") -> None:
+        super().__init__()
+        self._text = Text(glyph)
+
+    def render(self, task: Task) -> Text:
+        return self._text
+
+
+def progress_columns() -> tuple[ProgressColumn, ...]:
+    """
+    The standard 'label  bar  pct • eta • detail' layout. Labels and details are
+    plain text (markup=False): nothing to parse per frame, and file names with
+    brackets print as-is instead of being read as Rich markup.
+    """
+    return (
+        TextColumn("{task.description}", style="bold", markup=False),
         BarColumn(),
         TaskProgressColumn(),
-        TextColumn("•"),
+        _SeparatorColumn(),
         TimeRemainingColumn(),
-        TextColumn("• {task.fields[detail]}"),
-        console=console,
+        TextColumn("• {task.fields[detail]}", markup=False),
+    )
+
+
+def make_phase_progress(console: Console) -> tuple[Progress, RichPhaseProgressReporter]:
+    """Standardized Rich progress layout + reporter instance."""
+    progress = Progress(
+        *progress_columns(), console=console, refresh_per_second=REFRESH_PER_SECOND
     )
     return progress, RichPhaseProgressReporter(progress)
@@ -1,23 +1,21 @@
 # src/vi_app/modules/cleanup/service.py
 from __future__ import annotations
 
-import errno
 import os
 import re
 import shutil
 from collections.abc import Callable, Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from uuid import uuid4
 
-from PIL import Image
-from pillow_heif import register_heif_opener
-
 from vi_app.core.errors import BadRequest
+from vi_app.core.exif import read_datetime_taken
 from vi_app.core.media_types import IMAGE_EXTS as _IMAGE_EXTS
 from vi_app.core.media_types import VIDEO_EXTS as _VIDEO_EXTS
-from vi_app.core.paths import ensure_within_root
+from vi_app.core.paths import ensure_within_root, move_file, scan_dirs, scan_files
 from vi_app.core.progress import ProgressReporter
 
 from .schemas import (
@@ -39,10 +37,12 @@ class CleanupService:
     VIDEO_EXTS = _VIDEO_EXTS
 
     _HEIF_REGISTERED = False  # lazy, best-effort
+    _NEEDS_HEIF = True  # subclasses that never decode images skip pillow_heif
 
     def __init__(self, root: Path):
         self.root = Path(root).resolve()
-        self._ensure_heif_registered()
+        if self._NEEDS_HEIF:
+            self._ensure_heif_registered()
 
     # ---- env / platform helpers -------------------------------------------------
 
@@ -51,6 +51,8 @@ class CleanupService:
         if cls._HEIF_REGISTERED:
             return
         try:
+            from pillow_heif import register_heif_opener
+
             register_heif_opener()
             cls._HEIF_REGISTERED = True
         except Exception:
@@ -70,45 +72,26 @@ class CleanupService:
 
     # ---- filesystem traversal ---------------------------------------------------
 
-    def _iter_files(self) -> Iterable[Path]:
-        return (p for p in self.root.rglob("*") if p.is_file())
-
     @staticmethod
     def _iter_dirs_bottom_up(root: Path) -> Iterable[Path]:
-        yield from sorted(
-            (d for d in root.rglob("*") if d.is_dir()),
-            key=lambda x: len(x.parts),
-            reverse=True,
-        )
+        # Deepest first; depth is counted on the raw strings before any Path is built
+        for d in sorted(scan_dirs(root), key=lambda s: s.count(os.sep), reverse=True):
+            yield Path(d)
 
     @staticmethod
     def _walk_dirs(root: Path, recurse: bool) -> Iterator[Path]:
         root = root.resolve()
         yield root
         if recurse:
-            for p in root.rglob("*"):
-                if p.is_dir():
-                    yield p
+            for d in scan_dirs(root):
+                yield Path(d)
 
     @classmethod
     def _iter_images(cls, dir_path: Path) -> list[Path]:
+        # Extension is checked on the raw entry name; only matches become Paths
         return sorted(
-            [
-                p
-                for p in dir_path.iterdir()
-                if p.is_file() and p.suffix.lower() in cls.IMAGE_EXTS
-            ]
-        )
-
-    # NEW: videos in a directory
-    @classmethod
-    def _iter_videos(cls, dir_path: Path) -> list[Path]:
-        return sorted(
-            [
-                p
-                for p in dir_path.iterdir()
-                if p.is_file() and p.suffix.lower() in cls.VIDEO_EXTS
-            ]
+            Path(e.path)
+            for e in scan_files(dir_path, recurse=False, exts=cls.IMAGE_EXTS)
         )
 
     # ---- generic file ops -------------------------------------------------------
@@ -126,16 +109,19 @@ class CleanupService:
             i += 1
 
     @classmethod
-    def _safe_move(cls, src: Path, dst: Path) -> None:
-        dst.parent.mkdir(parents=True, exist_ok=True)
+    def _safe_move(
+        cls, src: Path, dst: Path, made_dirs: set[Path] | None = None
+    ) -> None:
+        """
+        Move `src` to a free name at `dst`. Pass one `made_dirs` set across a batch
+        so each destination folder is mkdir'd once rather than once per file.
+        """
+        if made_dirs is None or dst.parent not in made_dirs:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if made_dirs is not None:
+                made_dirs.add(dst.parent)
         dst = cls._unique_path(dst)
-        try:
-            src.rename(dst)
-        except OSError as e:
-            if e.errno == errno.EXDEV:
-                shutil.move(str(src), str(dst))
-            else:
-                raise
+        move_file(src, dst, overwrite=False)
 
     @classmethod
     def _safe_rename(cls, src: Path, dst: Path) -> None:
@@ -146,25 +132,17 @@ class CleanupService:
                     dst = cls._unique_path(dst)
             except Exception:
                 dst = cls._unique_path(dst)
+        move_file(src, dst, overwrite=False)
+
+    @staticmethod
+    def _unlink_quiet(path: Path) -> None:
         try:
-            src.rename(dst)
-        except OSError as e:
-            if e.errno == errno.EXDEV:
-                shutil.move(str(src), str(dst))
-            else:
-                raise
+            path.unlink(missing_ok=True)
+        except Exception:
+            pass
 
     # ---- exif/datetime helpers --------------------------------------------------
 
-    @staticmethod
-    def _parse_exif_datetime(value: str) -> datetime | None:
-        for fmt in ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y:%m:%d %H:%M:%S%z"):
-            try:
-                return datetime.strptime(value, fmt)
-            except Exception:
-                continue
-        return None
-
     @staticmethod
     def _filesystem_earliest_dt(path: Path) -> datetime:
         stat = path.stat()
@@ -180,28 +158,7 @@ class CleanupService:
         )
 
     def _get_datetime_taken(self, path: Path) -> datetime:
-        try:
-            with Image.open(path) as im:
-                exif = im.getexif()
-                if exif:
-                    for tag in (
-                        36867,
-                        36868,
-                        306,
-                    ):  # DateTimeOriginal, Digitized, DateTime
-                        v = exif.get(tag)
-                        if isinstance(v, bytes):
-                            try:
-                                v = v.decode(errors="ignore")
-                            except Exception:
-                                v = None
-                        if v:
-                            dt = self._parse_exif_datetime(str(v))
-                            if dt:
-                                return dt
-        except Exception:
-            pass
-        return self._filesystem_earliest_dt(path)
+        return read_datetime_taken(path) or self._filesystem_earliest_dt(path)
 
 
 # ------------------------------------------------------------------------------
@@ -210,32 +167,77 @@ class CleanupService:
 
 
 class RemoveFilesService(CleanupService):
-    def run(
-        self, patterns: list[str], dry_run: bool, remove_empty_dirs: bool
-    ) -> list[Path]:
-        if not patterns:
-            raise BadRequest("At least one pattern is required.")
+    _NEEDS_HEIF = False
+
+    # Backreferences, conditional group references, named groups and global
+    # inline flags: can't be fused into an alternation
+    _UNFUSABLE_RE = re.compile(r"\\\d|\(\?\(|\(\?P[<=]|\(\?[aiLmsux]+\)")
 
-        compiled: list[re.Pattern[str]] = []
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _compile_patterns(
+        cls, patterns: tuple[str, ...]
+    ) -> tuple[re.Pattern[str], ...]:
+        """
+        Compile patterns (plain strings match literally) into as few regexes as possible.
+        All patterns are normally fused into one alternation so each path is scanned
+        once; patterns using backreferences, conditional group references (?(1)...),
+        named groups or inline global flags stay separate, since fusing would renumber /
+        duplicate their groups or is not allowed mid-pattern.
+        Cached per pattern tuple, so a plan followed by an apply compiles once.
+        """
+        sources: list[str] = []
         for pat in patterns:
             if any(ch in pat for ch in r".*+?^$[](){}|\\"):
-                compiled.append(re.compile(pat, re.IGNORECASE))
+                try:
+                    re.compile(pat)  # surface errors for the pattern itself
+                except re.error as e:
+                    raise BadRequest(f"Invalid pattern {pat!r}: {e}") from e
+                sources.append(pat)
             else:
-                compiled.append(re.compile(re.escape(pat), re.IGNORECASE))
+                sources.append(re.escape(pat))
 
-        to_delete: list[Path] = []
-        for f in self._iter_files():
-            s = str(f)
+        fusable = [src for src in sources if not cls._UNFUSABLE_RE.search(src)]
+        separate = [src for src in sources if src not in fusable]
+        compiled = [re.compile(src, re.IGNORECASE) for src in separate]
+        if fusable:
+            combined = "|".join(f"(?:{src})" for src in fusable)
+            try:
+                compiled.insert(0, re.compile(combined, re.IGNORECASE))
+            except re.error:
+                # Anything the screen above misses still works, just unfused.
+                compiled[:0] = [re.compile(src, re.IGNORECASE) for src in fusable]
+        return tuple(compiled)
+
+    def iter_run(self, patterns: list[str]) -> Iterator[Path]:
+        """
+        Yield matching files as the walk finds them (plan only; nothing is deleted).
+        Directories are listed concurrently, so the order is unspecified.
+        """
+        if not patterns:
+            raise BadRequest("At least one pattern is required.")
+
+        compiled = self._compile_patterns(tuple(patterns))
+
+        # Match on the raw scandir path string; only hits are wrapped in a Path.
+        for entry in scan_files(self.root, workers=self._auto_worker_count()):
+            s = entry.path
             if any(rx.search(s) for rx in compiled):
-                to_delete.append(f)
+                yield Path(s)
+
+    def run(
+        self, patterns: list[str], dry_run: bool, remove_empty_dirs: bool
+    ) -> list[Path]:
+        # Sorted so the returned plan is stable despite the concurrent walk
+        to_delete = sorted(self.iter_run(patterns))
 
         if not dry_run:
-            for f in to_delete:
-                ensure_within_root(f, self.root)
-                try:
-                    f.unlink(missing_ok=True)
-                except Exception:
-                    pass
+            workers = self._auto_worker_count()
+            # Every candidate was listed from inside self.root without following
+            # symlinked dirs, so no per-file resolve()/root check is needed here.
+            # unlink is latency-bound, so keep several in flight at once
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                list(ex.map(self._unlink_quiet, to_delete))
 
             if remove_empty_dirs:
                 for d in self._iter_dirs_bottom_up(self.root):
@@ -251,21 +253,34 @@ class RemoveFilesService(CleanupService):
 
 
 class RemoveFoldersService(CleanupService):
-    def run(self, folder_names: list[str], dry_run: bool) -> list[Path]:
+    _NEEDS_HEIF = False
+
+    def iter_run(self, folder_names: list[str]) -> Iterator[Path]:
+        """Yield matching folders as the walk finds them, parents first (plan only)."""
         if not folder_names:
             raise BadRequest("At least one folder name is required.")
-
-        targets: list[Path] = []
         names_lower = {n.lower() for n in folder_names}
+        for d in scan_dirs(self.root):
+            if os.path.basename(d).lower() in names_lower:
+                yield Path(d)
 
-        for d in self._iter_dirs_bottom_up(self.root):
-            if d.name.lower() in names_lower:
-                targets.append(d)
+    def run(self, folder_names: list[str], dry_run: bool) -> list[Path]:
+        # Deepest first, matching the bottom-up order plans have always used
+        targets = sorted(
+            self.iter_run(folder_names), key=lambda d: len(d.parts), reverse=True
+        )
 
         if not dry_run:
             for d in targets:
                 ensure_within_root(d, self.root)
-                shutil.rmtree(d, ignore_errors=True)
+            # Remove only outermost matches (nested ones go with their parent), so no
+            # two concurrent rmtree calls ever walk the same subtree.
+            target_set = set(targets)
+            outermost = [
+                d for d in targets if not any(p in target_set for p in d.parents)
+            ]
+            with ThreadPoolExecutor(max_workers=self._auto_worker_count()) as ex:
+                list(ex.map(lambda d: shutil.rmtree(d, ignore_errors=True), outermost))
 
         return targets
 
@@ -291,25 +306,47 @@ class SortService(CleanupService):
         return [MoveItem(src=str(s), dst=str(d)) for s, d in pairs]
 
     def apply(
-        self, req: SortRequest, reporter: ProgressReporter | None = None
+        self,
+        req: SortRequest,
+        reporter: ProgressReporter | None = None,
+        planned: list[MoveItem] | None = None,
     ) -> list[MoveItem]:
-        strat = self._select(req.strategy)
-        pairs = strat.run(
-            self.root, Path(req.dst_root) if req.dst_root else None, reporter=reporter
-        )
+        """
+        Execute the moves. Pass `planned` (the result of plan()) to skip re-walking the
+        tree and re-reading EXIF/geocoding every file.
+        """
+        if planned is not None:
+            pairs = [(Path(m.src), Path(m.dst)) for m in planned]
+        else:
+            strat = self._select(req.strategy)
+            pairs = strat.run(
+                self.root,
+                Path(req.dst_root) if req.dst_root else None,
+                reporter=reporter,
+            )
+        if reporter:
+            reporter.start("move", total=len(pairs), text="Moving files…")
+        made_dirs: set[Path] = set()
         for src, dst in pairs:
+            if reporter:
+                reporter.update("move", 1, text=src.name)
             try:
                 if src.resolve() == dst.resolve():
                     continue
             except Exception:
                 pass
-            self._safe_move(src, dst)
+            self._safe_move(src, dst, made_dirs)
+        if reporter:
+            reporter.end("move")
         return [MoveItem(src=str(s), dst=str(d)) for s, d in pairs]
 
 
 class RenameService(CleanupService):
     """Parallel planning, two-phase apply, stable per-directory numbering."""
 
+    # Below this many targets, phase 2 isn't worth a thread pool
+    PARALLEL_FINALIZE_MIN = 256
+
     def __init__(self, root: Path, recurse: bool, zero_pad: int):
         super().__init__(root)
         self.recurse = recurse
@@ -317,24 +354,29 @@ class RenameService(CleanupService):
 
     # ---- planning (parallel date extraction) -----------------------------------
 
+    def _safe_datetime_taken(self, path: Path) -> datetime:
+        try:
+            return self._get_datetime_taken(path) or datetime.min
+        except Exception:
+            return datetime.min
+
     def _sequence_names(
         self, dir_path: Path, files: list[Path]
     ) -> list[tuple[Path, Path]]:
-        results: list[tuple[datetime, Path]] = []
         workers = self._auto_worker_count()
         with ThreadPoolExecutor(max_workers=workers) as ex:
-            futs = {ex.submit(self._get_datetime_taken, p): p for p in files}
-            for fut in as_completed(futs):
-                p = futs[fut]
-                try:
-                    dt = fut.result() or datetime.min
-                except Exception:
-                    dt = datetime.min
-                results.append((dt, p))
+            dates = list(ex.map(self._safe_datetime_taken, files))
 
-        results.sort(key=lambda t: (t[0], t[1].name.lower()))
+        # Sort on flat (date, lowercase name) keys built once per file, rather than
+        # re-deriving Path.name through a key lambda on every comparison.
+        keys = [
+            (dt, p.name.lower(), i)
+            for i, (dt, p) in enumerate(zip(dates, files, strict=True))
+        ]
+        keys.sort()
         pairs: list[tuple[Path, Path]] = []
-        for idx, (_, p) in enumerate(results, start=1):
+        for idx, (_, _, i) in enumerate(keys, start=1):
+            p = files[i]
             seq = f"{idx:0{self.zero_pad}d}"
             # Preserve original extension; normalize to lowercase to match your example
             new_name = f"IMG_{seq}{p.suffix.lower()}"
@@ -348,12 +390,13 @@ class RenameService(CleanupService):
         Create a single sequence across ALL video formats in this directory.
         Order is by earliest filesystem datetime, then name.
         """
-        items = sorted(
-            ((self._filesystem_earliest_dt(p), p) for p in files),
-            key=lambda t: (t[0], t[1].name.lower()),
+        keys = sorted(
+            (self._filesystem_earliest_dt(p), p.name.lower(), i)
+            for i, p in enumerate(files)
         )
         pairs: list[tuple[Path, Path]] = []
-        for idx, (_, p) in enumerate(items, start=1):
+        for idx, (_, _, i) in enumerate(keys, start=1):
+            p = files[i]
             seq = f"{idx:0{zero_pad}d}"
             new_name = f"VID_{seq}{p.suffix.lower()}"
             pairs.append((p, dir_path / new_name))
@@ -362,7 +405,15 @@ class RenameService(CleanupService):
     def plan(
         self, on_discover: Callable[[int], None] | None = None
     ) -> list[RenamedItem]:
-        items: list[RenamedItem] = []
+        return [
+            RenamedItem(src=str(src), dst=str(dst))
+            for src, dst in self.enumerate_targets(on_discover=on_discover)
+        ]
+
+    def enumerate_targets(
+        self, on_discover: Callable[[int], None] | None = None
+    ) -> list[tuple[Path, Path]]:
+        pairs: list[tuple[Path, Path]] = []
         discovered = 0
         for d in self._walk_dirs(self.root, self.recurse):
             files = self._iter_images(d)
@@ -372,35 +423,47 @@ class RenameService(CleanupService):
             if on_discover:
                 on_discover(discovered)
             for src, dst in self._sequence_names(d, files):
-                if src.name == dst.name:
-                    continue
-                items.append(RenamedItem(src=str(src), dst=str(dst)))
-        return items
-
-    def enumerate_targets(
-        self, on_discover: Callable[[int], None] | None = None
-    ) -> list[tuple[Path, Path]]:
-        items = self.plan(on_discover=on_discover)
-        return [(Path(it.src), Path(it.dst)) for it in items]
+                if src.name != dst.name:
+                    pairs.append((src, dst))
+        return pairs
 
-    # NEW: enumerate video targets with a caller-provided zero-pad
-    def enumerate_video_targets(
-        self, zero_pad: int, on_discover: Callable[[int], None] | None = None
-    ) -> list[tuple[Path, Path]]:
-        items: list[RenamedItem] = []
+    def enumerate_all(
+        self,
+        video_zero_pad: int | None = None,
+        on_discover: Callable[[int], None] | None = None,
+    ) -> tuple[list[tuple[Path, Path]], list[tuple[Path, Path]]]:
+        """
+        Plan image and video renames in one walk: each directory is listed once and
+        its entries are split by extension, instead of walking the tree per kind.
+        Returns (image_targets, video_targets).
+        """
+        vid_pad = self.zero_pad if video_zero_pad is None else video_zero_pad
+        media_exts = self.IMAGE_EXTS | self.VIDEO_EXTS
+        img_pairs: list[tuple[Path, Path]] = []
+        vid_pairs: list[tuple[Path, Path]] = []
         discovered = 0
         for d in self._walk_dirs(self.root, self.recurse):
-            files = self._iter_videos(d)
-            if not files:
+            images: list[Path] = []
+            videos: list[Path] = []
+            for e in scan_files(d, recurse=False, exts=media_exts):
+                ext = os.path.splitext(e.name)[1].lower()
+                (images if ext in self.IMAGE_EXTS else videos).append(Path(e.path))
+            if not images and not videos:
                 continue
-            discovered += len(files)
+            discovered += len(images) + len(videos)
             if on_discover:
                 on_discover(discovered)
-            for src, dst in self._sequence_video_names(d, files, zero_pad):
-                if src.name == dst.name:
-                    continue
-                items.append(RenamedItem(src=str(src), dst=str(dst)))
-        return [(Path(it.src), Path(it.dst)) for it in items]
+            if images:
+                images.sort()
+                for src, dst in self._sequence_names(d, images):
+                    if src.name != dst.name:
+                        img_pairs.append((src, dst))
+            if videos:
+                videos.sort()
+                for src, dst in self._sequence_video_names(d, videos, vid_pad):
+                    if src.name != dst.name:
+                        vid_pairs.append((src, dst))
+        return img_pairs, vid_pairs
 
     # ---- apply (two-phase) ------------------------------------------------------
 
@@ -413,53 +476,92 @@ class RenameService(CleanupService):
             if not candidate.exists():
                 return candidate
 
+    def _stage_one(
+        self, target: tuple[Path, Path]
+    ) -> tuple[Path, Path, Path | None, str | None]:
+        src, dst = target
+        try:
+            if src.resolve() == dst.resolve():
+                return src, dst, None, "already_named"
+            tmp = self._stage_path_for(src)
+            os.rename(os.fspath(src), os.fspath(tmp))  # one C call, no Path result
+            return src, dst, tmp, None
+        except Exception as e:
+            return src, dst, None, f"stage_error:{e.__class__.__name__}"
+
+    def _finalize_one(
+        self, orig_src: Path, tmp: Path, dst: Path
+    ) -> tuple[Path, Path, bool, str | None]:
+        try:
+            final = dst
+            try:
+                if final.exists() and tmp.resolve() != final.resolve():
+                    final = self._unique_path(final)
+            except Exception:
+                final = self._unique_path(final)
+            # os.rename, not os.replace: on Windows a file that appeared at
+            # `final` since the check above is refused instead of overwritten
+            os.rename(os.fspath(tmp), os.fspath(final))
+            return orig_src, final, True, None
+        except Exception as e:
+            try:
+                if not orig_src.exists() and tmp.exists():
+                    os.rename(os.fspath(tmp), os.fspath(orig_src))
+            except Exception:
+                pass
+            return orig_src, dst, False, f"final_error:{e.__class__.__name__}"
+
+    def _finalize_dir(
+        self, staged: list[tuple[Path, Path, Path]]
+    ) -> list[tuple[Path, Path, bool, str | None]]:
+        return [self._finalize_one(*rec) for rec in staged]
+
     def _apply_two_phase(
-        self, targets: list[tuple[Path, Path]]
+        self, targets: list[tuple[Path, Path]], parallel: bool | None = None
     ) -> list[tuple[Path, Path, bool, str | None]]:
+        """
+        parallel: finalize folders concurrently (None = auto, on for large batches).
+        Final names can only collide within one folder, so each folder's renames
+        stay in order on one worker while different folders overlap, which pays off
+        most on network shares where every rename is a round trip.
+        """
         results: list[tuple[Path, Path, bool, str | None]] = []
         staged: list[tuple[Path, Path, Path]] = []  # (orig_src, tmp, dst)
 
-        # Phase 1: stage everything
-        for src, dst in targets:
-            try:
-                if src.resolve() == dst.resolve():
-                    results.append((src, dst, False, "already_named"))
-                    continue
-                tmp = self._stage_path_for(src)
-                src.rename(tmp)
-                staged.append((src, tmp, dst))
-            except Exception as e:
-                results.append((src, dst, False, f"stage_error:{e.__class__.__name__}"))
-
-        # Phase 2: move staged -> final
-        for orig_src, tmp, dst in staged:
-            try:
-                final = dst
-                try:
-                    if final.exists() and tmp.resolve() != final.resolve():
-                        final = self._unique_path(final)
-                except Exception:
-                    final = self._unique_path(final)
-                tmp.rename(final)
-                results.append((orig_src, final, True, None))
-            except Exception as e:
-                try:
-                    if not orig_src.exists() and tmp.exists():
-                        tmp.rename(orig_src)
-                except Exception:
-                    pass
-                results.append(
-                    (orig_src, dst, False, f"final_error:{e.__class__.__name__}")
-                )
+        # Phase 1: stage everything (independent per file, so run on a thread pool;
+        # map() keeps results in target order)
+        workers = self._auto_worker_count()
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for src, dst, tmp, reason in ex.map(self._stage_one, targets):
+                if tmp is None:
+                    results.append((src, dst, False, reason))
+                else:
+                    staged.append((src, tmp, dst))
+
+        # Phase 2: move staged -> final (serial per folder: final names may collide)
+        if parallel is None:
+            parallel = len(staged) > self.PARALLEL_FINALIZE_MIN
+        by_dir: dict[Path, list[tuple[Path, Path, Path]]] = {}
+        for rec in staged:
+            by_dir.setdefault(rec[2].parent, []).append(rec)
+        if parallel and len(by_dir) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(by_dir))) as ex:
+                for done in ex.map(self._finalize_dir, by_dir.values()):
+                    results.extend(done)
+        else:
+            for group in by_dir.values():
+                results.extend(self._finalize_dir(group))
 
         return results
 
     def iter_apply(
-        self, targets: list[tuple[Path, Path]] | None = None
+        self,
+        targets: list[tuple[Path, Path]] | None = None,
+        parallel: bool | None = None,
     ) -> Iterator[tuple[Path, Path, bool, str | None]]:
         if targets is None:
             targets = self.enumerate_targets(on_discover=None)
-        yield from self._apply_two_phase(targets)
+        yield from self._apply_two_phase(targets, parallel=parallel)
 
     def apply(self) -> RenameBySequenceResponse:
         targets = self.enumerate_targets(on_discover=None)
@@ -1,11 +1,13 @@
 # src/vi_app/modules/cleanup/strategies/base.py
 from __future__ import annotations
 
+import os
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from pathlib import Path
 
 from vi_app.core.media_types import IMAGE_EXTS
+from vi_app.core.paths import scan_files
 from vi_app.core.progress import ProgressReporter
 
 
@@ -13,6 +15,8 @@ class SortStrategyBase(ABC):
     """DRY base for cleanup sorting strategies."""
 
     exts = IMAGE_EXTS
+    # Threads for per-file header reads while planning (I/O-bound heuristic)
+    max_workers = max(4, min(16, (os.cpu_count() or 4) * 2))
 
     def iter_images(
         self, root: Path, reporter: ProgressReporter | None = None
@@ -20,11 +24,10 @@ class SortStrategyBase(ABC):
         root = root.resolve()
         if reporter:
             reporter.start("scan", total=None, text="Discovering images…")
-        for p in root.rglob("*"):
-            if p.is_file() and p.suffix.lower() in self.exts:
-                if reporter:
-                    reporter.update("scan", 1, text=p.name)
-                yield p
+        for e in scan_files(root, exts=self.exts):
+            if reporter:
+                reporter.update("scan", 1, text=e.name)
+            yield Path(e.path)
         if reporter:
             reporter.end("scan")
 
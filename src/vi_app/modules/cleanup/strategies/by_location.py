@@ -3,9 +3,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from geopy.geocoders import Nominatim
-from PIL import ExifTags, Image
+from PIL import ExifTags
 
+from vi_app.core.exif import load_exif
 from vi_app.core.paths import sanitize_filename
 from vi_app.core.progress import ProgressReporter
 
@@ -19,6 +19,13 @@ class SortByLocationStrategy(SortStrategyBase):
 
     # Simple in-class cache to avoid decorator complications with methods
     _geocode_cache: dict[tuple[float, float], tuple[str | None, str | None]] = {}
+    _geocoder = None  # shared Nominatim client, created on first lookup
+
+    # GPS sub-IFD tag ids, resolved once instead of inverting GPSTAGS per image
+    _GPS_LAT = ExifTags.GPS.GPSLatitude
+    _GPS_LAT_REF = ExifTags.GPS.GPSLatitudeRef
+    _GPS_LON = ExifTags.GPS.GPSLongitude
+    _GPS_LON_REF = ExifTags.GPS.GPSLongitudeRef
 
     def run(
         self,
@@ -34,6 +41,7 @@ class SortByLocationStrategy(SortStrategyBase):
             gps = self._get_exif_gps(src)
             city = country = None
             if gps:
+                # rounding to ~11m lets nearby shots share one cached lookup
                 lat = round(gps[0], 4)
                 lon = round(gps[1], 4)
                 city, country = self._reverse_geocode(lat, lon)
@@ -55,63 +63,69 @@ class SortByLocationStrategy(SortStrategyBase):
 
     # ---- helpers ----
     @staticmethod
-    def _ratio_to_float(x):
+    def _ratio_to_float(x) -> float:
         try:
             return float(x)
         except Exception:
             num, den = x
             return float(num) / float(den)
 
+    @classmethod
+    def _dms_to_deg(cls, dms) -> float:
+        d, m, s = dms
+        return (
+            cls._ratio_to_float(d)
+            + cls._ratio_to_float(m) / 60.0
+            + cls._ratio_to_float(s) / 3600.0
+        )
+
     @classmethod
     def _get_exif_gps(cls, p: Path) -> tuple[float, float] | None:
         try:
-            with Image.open(p) as im:
-                exif = im.getexif() or {}
-                if not exif:
-                    return None
-                tags = {ExifTags.TAGS.get(k, k): v for k, v in exif.items()}
-                gps = tags.get("GPSInfo")
-                if not gps:
-                    return None
-                inv = {v: k for k, v in ExifTags.GPSTAGS.items()}
-                lat = gps.get(inv.get("GPSLatitude"))
-                lat_ref = gps.get(inv.get("GPSLatitudeRef"))
-                lon = gps.get(inv.get("GPSLongitude"))
-                lon_ref = gps.get(inv.get("GPSLongitudeRef"))
-                if not (lat and lon and lat_ref and lon_ref):
-                    return None
-
-                def _dms_to_deg(dms):
-                    d, m, s = dms
-                    return (
-                        cls._ratio_to_float(d)
-                        + cls._ratio_to_float(m) / 60.0
-                        + cls._ratio_to_float(s) / 3600.0
-                    )
-
-                lat_deg = _dms_to_deg(lat)
-                lon_deg = _dms_to_deg(lon)
-                if isinstance(lat_ref, bytes):
-                    lat_ref = lat_ref.decode(errors="ignore")
-                if isinstance(lon_ref, bytes):
-                    lon_ref = lon_ref.decode(errors="ignore")
-                if str(lat_ref).upper().startswith("S"):
-                    lat_deg = -lat_deg
-                if str(lon_ref).upper().startswith("W"):
-                    lon_deg = -lon_deg
-                return lat_deg, lon_deg
+            exif = load_exif(p)  # APP1-only read for JPEGs
+            if not exif:
+                return None
+            # IFD0 only holds the GPS IFD's offset; the tags live in the sub-IFD
+            gps = exif.get_ifd(ExifTags.IFD.GPSInfo)
+            if not gps:
+                return None
+            lat = gps.get(cls._GPS_LAT)
+            lat_ref = gps.get(cls._GPS_LAT_REF)
+            lon = gps.get(cls._GPS_LON)
+            lon_ref = gps.get(cls._GPS_LON_REF)
+            if not (lat and lon and lat_ref and lon_ref):
+                return None
+
+            lat_deg = cls._dms_to_deg(lat)
+            lon_deg = cls._dms_to_deg(lon)
+            if isinstance(lat_ref, bytes):
+                lat_ref = lat_ref.decode(errors="ignore")
+            if isinstance(lon_ref, bytes):
+                lon_ref = lon_ref.decode(errors="ignore")
+            if str(lat_ref).upper().startswith("S"):
+                lat_deg = -lat_deg
+            if str(lon_ref).upper().startswith("W"):
+                lon_deg = -lon_deg
+            return lat_deg, lon_deg
         except Exception:
             return None
         return None
 
+    @classmethod
+    def _get_geocoder(cls):
+        if cls._geocoder is None:
+            from geopy.geocoders import Nominatim  # deferred: ~100ms import
+
+            cls._geocoder = Nominatim(user_agent="venture-image", timeout=10)
+        return cls._geocoder
+
     @classmethod
     def _reverse_geocode(cls, lat: float, lon: float) -> tuple[str | None, str | None]:
         key = (lat, lon)
         if key in cls._geocode_cache:
             return cls._geocode_cache[key]
-        geocoder = Nominatim(user_agent="venture-image", timeout=10)
         try:
-            loc = geocoder.reverse((lat, lon), language="en")
+            loc = cls._get_geocoder().reverse((lat, lon), language="en")
             if not loc or not loc.raw:
                 result = (None, None)
             else:
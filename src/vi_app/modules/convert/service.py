@@ -1,12 +1,23 @@
 # src/vi_app/modules/convert/service.py
 from __future__ import annotations
 
+import multiprocessing
 import os
 import shutil
 import subprocess
 from collections.abc import Callable, Iterable, Iterator, Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain, islice
 from pathlib import Path
+from typing import TypeVar
 
 from PIL import Image, ImageCms
 
@@ -21,7 +32,10 @@ try:
 except Exception:
     _HEIF_OK = False
 
-from vi_app.core.paths import mirrored_output_path, sanitize_filename
+from vi_app.core.paths import mirrored_output_str, sanitize_filename, scan_files
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 
 _SUPPORTED_EXTS = {
     ".jpg",
@@ -37,6 +51,138 @@ _SUPPORTED_EXTS = {
 }
 DEFAULT_CONVERT_SUBDIR = "converted"
 
+# Built once and shared: the target profile is identical for every image
+_SRGB_PROFILE = ImageCms.ImageCmsProfile(ImageCms.createProfile("sRGB"))
+
+
+@lru_cache(maxsize=32)
+def _to_srgb_transform(icc: bytes, mode: str) -> ImageCms.ImageCmsTransform:
+    """Source-ICC -> sRGB transform; photos from one camera share a single build."""
+    return ImageCms.buildTransform(
+        ImageCms.ImageCmsProfile(BytesIO(icc)), _SRGB_PROFILE, mode, "RGB"
+    )
+
+
+def _nested_output(src_root: Path, dst_root: Path) -> set[str] | None:
+    """
+    The output folder when it sits inside the source tree (the 'converted' default),
+    so scans skip it instead of re-planning previous outputs.
+    """
+    if src_root in dst_root.parents:
+        return {os.fspath(dst_root)}
+    return None
+
+
+def _windowed(
+    submit: Callable[[_T], Future[_R]], items: Iterable[_T], window: int
+) -> Iterator[tuple[_T, Future[_R]]]:
+    """
+    Yield (item, finished future) in completion order, with at most `window`
+    submitted at once: results flow back while a streamed walk is still running,
+    and only the in-flight pairs are held in memory.
+    """
+    it = iter(items)
+    pending: dict[Future[_R], _T] = {}
+    while True:
+        for item in islice(it, window - len(pending)):
+            pending[submit(item)] = item
+        if not pending:
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in done:
+            yield pending.pop(fut), fut
+
+
+def _convert_one(
+    src: Path,
+    dst: Path,
+    quality: int,
+    overwrite: bool,
+    flatten_alpha: bool,
+    dry_run: bool = False,
+    make_parent: bool = True,
+) -> tuple[bool, str | None]:
+    """
+    Convert one image to JPEG. Module-level (not a method) so ProcessPoolExecutor
+    can pickle it: workers get the settings as arguments, not the whole service.
+    make_parent=False when the caller has already created dst's folder.
+    """
+    if dst.exists() and not overwrite:
+        return False, "exists"
+    if dry_run:
+        return True, "dry_run"
+
+    try:
+        if make_parent:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+        with Image.open(src) as im:
+            # capture metadata BEFORE transforms
+            exif_bytes = im.info.get("exif")
+            xmp_bytes = im.info.get("xmp")
+            icc_bytes = im.info.get("icc_profile")
+
+            # the transforms below yield plain Images, not the opened ImageFile
+            img: Image.Image = im
+
+            # color management to sRGB if possible
+            try:
+                if "icc_profile" in img.info and img.info["icc_profile"]:
+                    transform = _to_srgb_transform(
+                        bytes(img.info["icc_profile"]), img.mode
+                    )
+                    srgb = ImageCms.applyTransform(img, transform)
+                    if srgb is not None:
+                        img = srgb
+                        icc_bytes = None  # don't embed old profile after conversion
+            except Exception:
+                pass
+
+            # alpha flattening; a palette only carries alpha when it declares
+            # a transparent index, so opaque GIF/PNG-8 go straight to RGB below
+            if flatten_alpha and (
+                img.mode == "PA" or (img.mode == "P" and "transparency" in img.info)
+            ):
+                img = img.convert("RGBA")
+            if img.mode in ("RGBA", "LA") and flatten_alpha:
+                alpha = img.getchannel("A")
+                if alpha.getextrema()[0] == 255:
+                    # alpha band present but fully opaque (common for PNG exports):
+                    # nothing to composite, so skip the white canvas altogether
+                    img = img.convert("RGB")
+                else:
+                    # paste() composites LA/RGBA onto RGB directly; getchannel() pulls
+                    # just the alpha band instead of split()'s copy of every band
+                    bg = Image.new("RGB", img.size, (255, 255, 255))
+                    bg.paste(img, mask=alpha)
+                    img = bg
+            elif img.mode != "RGB":
+                # HEIF decodes (and ICC transforms) already yield RGB; convert()
+                # would only make a full-size copy of the pixels.
+                img = img.convert("RGB")
+
+            # Baseline, default Huffman tables: optimize/progressive each add an
+            # extra pass over the coefficients for a few % smaller files
+            save_kwargs: dict[str, object] = {
+                "format": "JPEG",
+                "quality": quality,
+                "optimize": False,
+                "progressive": False,
+            }
+            if exif_bytes:
+                save_kwargs["exif"] = exif_bytes
+            if xmp_bytes:
+                save_kwargs["xmp"] = xmp_bytes
+            if icc_bytes:
+                save_kwargs["icc_profile"] = icc_bytes
+
+            img.save(dst, **save_kwargs)
+
+        return True, None
+    except Exception as e:
+        if src.suffix.lower() in {".heic", ".heif"} and not _HEIF_OK:
+            return False, "heic_not_supported"
+        return False, f"error:{e.__class__.__name__}"
+
 
 class ConvertService(CleanupService):
     """
@@ -54,6 +200,7 @@ class ConvertService(CleanupService):
         flatten_alpha: bool,
         only_exts: set[str] | None = None,
         dry_run: bool = True,
+        workers: int | None = None,
     ):
         super().__init__(root=src_root)
         self.src_root = Path(src_root).expanduser().resolve()
@@ -63,25 +210,41 @@ class ConvertService(CleanupService):
             else (self.src_root / DEFAULT_CONVERT_SUBDIR)
         )
         self.recurse = recurse
+        self.workers = workers  # None -> auto (see _auto_process_count)
         self.quality = quality
         self.overwrite = overwrite
         self.flatten_alpha = flatten_alpha
         self.only_exts = {e.lower() for e in (only_exts or _SUPPORTED_EXTS)}
         self.dry_run = dry_run
 
+    @staticmethod
+    def _auto_process_count() -> int:
+        return os.cpu_count() or 1  # CPU-bound: one process per core
+
     # ---------- planning ----------
-    def _iter_images(self, reporter: ProgressReporter | None = None) -> Iterable[Path]:
-        """Yield source images, optionally reporting 'scan' progress."""
-        it = (
-            (p for p in self.src_root.rglob("*"))
-            if self.recurse
-            else (p for p in self.src_root.iterdir())
-        )
-        for p in it:
-            if p.is_file() and p.suffix.lower() in self.only_exts:
-                if reporter:
-                    reporter.update("scan", 1, text=p.name)
-                yield p
+    def _iter_images(
+        self, reporter: ProgressReporter | None = None
+    ) -> Iterable[os.DirEntry[str]]:
+        """Yield source image entries, optionally reporting 'scan' progress."""
+        for e in scan_files(
+            self.src_root,
+            recurse=self.recurse,
+            exts=self.only_exts,
+            exclude=_nested_output(self.src_root, self.dst_root),
+        ):
+            if reporter:
+                reporter.update("scan", 1, text=e.name)
+            yield e
+
+    def iter_targets(
+        self, reporter: ProgressReporter | None = None
+    ) -> Iterator[tuple[Path, Path]]:
+        """Stream (src, dst) pairs as the walk finds them, without a 'scan' start/end."""
+        src_root, dst_root = os.fspath(self.src_root), os.fspath(self.dst_root)
+        for e in self._iter_images(reporter=reporter):
+            new_name = sanitize_filename(os.path.splitext(e.name)[0]) + ".jpeg"
+            dst = mirrored_output_str(e.path, src_root, dst_root, new_name)
+            yield Path(e.path), Path(dst)
 
     def enumerate_targets(
         self, reporter: ProgressReporter | None = None
@@ -89,108 +252,92 @@ class ConvertService(CleanupService):
         """Plan conversions as (src, dst) pairs and optionally report 'scan' start/end."""
         if reporter:
             reporter.start("scan", total=None, text="Discovering images…")
-        pairs: list[tuple[Path, Path]] = []
-        for src in self._iter_images(reporter=reporter):
-            new_name = sanitize_filename(src.stem) + ".jpeg"
-            dst = mirrored_output_path(src, self.src_root, self.dst_root, new_name)
-            pairs.append((src, dst))
+        pairs = list(self.iter_targets(reporter=reporter))
         if reporter:
             reporter.end("scan")
         return pairs
 
-    # ---------- single conversion ----------
-    def _to_jpeg(self, src: Path, dst: Path) -> tuple[bool, str | None]:
-        if dst.exists() and not self.overwrite:
-            return False, "exists"
-        if self.dry_run:
-            return True, "dry_run"
-
-        try:
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            with Image.open(src) as im:
-                # capture metadata BEFORE transforms
-                exif_bytes = im.info.get("exif")
-                xmp_bytes = im.info.get("xmp")
-                icc_bytes = im.info.get("icc_profile")
-
-                # color management to sRGB if possible
-                try:
-                    if "icc_profile" in im.info and im.info["icc_profile"]:
-                        srgb = ImageCms.createProfile("sRGB")
-                        src_profile = ImageCms.ImageCmsProfile(
-                            bytes(im.info["icc_profile"])
-                        )
-                        im = ImageCms.profileToProfile(
-                            im, src_profile, srgb, outputMode="RGB"
-                        )
-                        icc_bytes = None  # don't embed old profile after conversion
-                except Exception:
-                    pass
-
-                # alpha flattening
-                if im.mode in ("RGBA", "LA") and self.flatten_alpha:
-                    bg = Image.new("RGB", im.size, (255, 255, 255))
-                    if im.mode != "RGBA":
-                        im = im.convert("RGBA")
-                    bg.paste(im, mask=im.split()[-1])
-                    im = bg
-                else:
-                    im = im.convert("RGB")
-
-                save_kwargs: dict[str, object] = {
-                    "format": "JPEG",
-                    "quality": self.quality,
-                    "optimize": True,
-                    "progressive": True,
-                }
-                if exif_bytes:
-                    save_kwargs["exif"] = exif_bytes
-                if xmp_bytes:
-                    save_kwargs["xmp"] = xmp_bytes
-                if icc_bytes:
-                    save_kwargs["icc_profile"] = icc_bytes
-
-                im.save(dst, **save_kwargs)
-
-            return True, None
-        except Exception as e:
-            if src.suffix.lower() in {".heic", ".heif"} and not _HEIF_OK:
-                return False, "heic_not_supported"
-            return False, f"error:{e.__class__.__name__}"
-
     # ---------- high-level facade (mirrors DedupService style) ----------
     def plan(self, reporter: ProgressReporter | None = None) -> list[tuple[Path, Path]]:
         """Public plan API (phase-aware)."""
         return self.enumerate_targets(reporter=reporter)
 
     # ---------- apply (parallel) ----------
+    @staticmethod
+    def _with_parents(
+        targets: Iterable[tuple[Path, Path]],
+    ) -> Iterator[tuple[Path, Path, bool]]:
+        """
+        Create each destination folder once, here, instead of a mkdir per file in
+        the workers. Yields (src, dst, need_dir): need_dir is only True when the
+        folder couldn't be made, so the worker retries and reports the real error.
+        """
+        made: set[str] = set()
+        for src, dst in targets:
+            parent = os.path.dirname(dst)
+            if parent not in made:
+                try:
+                    os.makedirs(parent, exist_ok=True)
+                except OSError:
+                    yield src, dst, True
+                    continue
+                made.add(parent)
+            yield src, dst, False
+
     def iter_apply(
         self,
-        targets: Sequence[tuple[Path, Path]] | None = None,
+        targets: Iterable[tuple[Path, Path]] | None = None,
         on_progress: Callable[[int], None] | None = None,
     ) -> Iterator[tuple[Path, Path, bool, str | None]]:
         """
-        Yield (src, dst, ok, reason) for each target. Runs in parallel using a thread pool.
+        Yield (src, dst, ok, reason) for each target. Runs in parallel using a process pool.
+        Without `targets` the tree is walked lazily: conversions start as soon as
+        the first images are found instead of after the whole scan. At most two
+        conversions per worker are queued at a time, so results stream back and
+        only the in-flight pairs are held in memory.
         """
-        targets = list(targets or self.enumerate_targets())
-        if not targets:
-            return iter(())  # empty iterator
+        todo = self.iter_targets() if targets is None else targets
+        if isinstance(todo, Sequence) and not todo:
+            return
 
         # dry-run fast path (no threads)
         if self.dry_run:
-            for src, dst in targets:
+            for src, dst in todo:
                 yield (src, dst, True, "dry_run")
                 if on_progress:
                     on_progress(1)
             return
 
-        workers = self._auto_worker_count()
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futs = {
-                ex.submit(self._to_jpeg, src, dst): (src, dst) for src, dst in targets
-            }
-            for fut in as_completed(futs):
-                src, dst = futs[fut]
+        workers = self.workers or self._auto_process_count()
+        window = 2 * workers
+        rest = iter(self._with_parents(todo))
+        # Look ahead one window before starting the pool: a tree with only a few
+        # images gets that many processes (or none), not one per core
+        head = list(islice(rest, window))
+        if len(head) < window:
+            workers = min(workers, len(head))
+        args = (self.quality, self.overwrite, self.flatten_alpha, self.dry_run)
+        if workers <= 1:
+            for src, dst, need_dir in chain(head, rest):
+                ok, reason = _convert_one(src, dst, *args, make_parent=need_dir)
+                if on_progress:
+                    on_progress(1)
+                yield (src, dst, ok, reason)
+            return
+
+        # Decode/ICC/encode are CPU-bound and only partly release the GIL, so fan
+        # out across processes rather than threads
+        # spawn, not fork: the CLI runs this next to live progress/console threads
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as ex:
+
+            def _submit(
+                t: tuple[Path, Path, bool],
+            ) -> Future[tuple[bool, str | None]]:
+                return ex.submit(_convert_one, t[0], t[1], *args, make_parent=t[2])
+
+            for (src, dst, _), fut in _windowed(_submit, chain(head, rest), window):
                 ok, reason = False, None
                 try:
                     ok, reason = fut.result()
@@ -201,10 +348,16 @@ class ConvertService(CleanupService):
                 yield (src, dst, ok, reason)
 
     def apply(
-        self, reporter: ProgressReporter | None = None
+        self,
+        reporter: ProgressReporter | None = None,
+        targets: Sequence[tuple[Path, Path]] | None = None,
     ) -> list[tuple[Path, Path, bool, str | None]]:
-        """Public apply API (phase-aware)."""
-        targets = self.enumerate_targets(reporter=reporter)
+        """
+        Public apply API (phase-aware). Pass the pairs from plan() as `targets` to
+        convert exactly what was shown without walking the tree a second time.
+        """
+        if targets is None:
+            targets = self.enumerate_targets(reporter=reporter)
         total = len(targets)
         if reporter:
             reporter.start("convert", total=total, text="Converting to JPEG…")
@@ -246,6 +399,8 @@ class Mp4ConvertService(CleanupService):
     Parity with ConvertService: plan() / iter_apply() / apply(), with ProgressReporter phases.
     """
 
+    _NEEDS_HEIF = False
+
     def __init__(
         self,
         src_root: Path,
@@ -280,24 +435,35 @@ class Mp4ConvertService(CleanupService):
         self.dry_run = dry_run
 
     # ---------- planning ----------
-    def _iter_videos(self, reporter: ProgressReporter | None = None) -> Iterable[Path]:
-        it = (self.src_root.rglob("*")) if self.recurse else self.src_root.iterdir()
-        for p in it:
-            if p.is_file() and p.suffix.lower() in self.only_exts:
-                if reporter:
-                    reporter.update("scan", 1, text=p.name)
-                yield p
+    def _iter_videos(
+        self, reporter: ProgressReporter | None = None
+    ) -> Iterable[os.DirEntry[str]]:
+        for e in scan_files(
+            self.src_root,
+            recurse=self.recurse,
+            exts=self.only_exts,
+            exclude=_nested_output(self.src_root, self.dst_root),
+        ):
+            if reporter:
+                reporter.update("scan", 1, text=e.name)
+            yield e
+
+    def iter_targets(
+        self, reporter: ProgressReporter | None = None
+    ) -> Iterator[tuple[Path, Path]]:
+        """Stream (src, dst) pairs as the walk finds them, without a 'scan' start/end."""
+        src_root, dst_root = os.fspath(self.src_root), os.fspath(self.dst_root)
+        for e in self._iter_videos(reporter=reporter):
+            new_name = sanitize_filename(os.path.splitext(e.name)[0]) + ".mp4"
+            dst = mirrored_output_str(e.path, src_root, dst_root, new_name)
+            yield Path(e.path), Path(dst)
 
     def enumerate_targets(
         self, reporter: ProgressReporter | None = None
     ) -> list[tuple[Path, Path]]:
         if reporter:
             reporter.start("scan", total=None, text="Discovering videos…")
-        pairs: list[tuple[Path, Path]] = []
-        for src in self._iter_videos(reporter=reporter):
-            new_name = sanitize_filename(src.stem) + ".mp4"
-            dst = mirrored_output_path(src, self.src_root, self.dst_root, new_name)
-            pairs.append((src, dst))
+        pairs = list(self.iter_targets(reporter=reporter))
         if reporter:
             reporter.end("scan")
         return pairs
@@ -366,19 +532,27 @@ class Mp4ConvertService(CleanupService):
     # ---------- parallel apply ----------
     def iter_apply(
         self,
-        targets: Sequence[tuple[Path, Path]] | None = None,
+        targets: Iterable[tuple[Path, Path]] | None = None,
         on_progress: Callable[[int], None] | None = None,
         workers: int | None = None,
     ) -> Iterator[tuple[Path, Path, bool, str | None]]:
-        targets = targets or self.enumerate_targets()
+        # No targets: stream, so encodes start during the walk
+        todo = self.iter_targets() if targets is None else targets
 
         def _one(src: Path, dst: Path) -> tuple[Path, Path, bool, str | None]:
             ok, reason = self._to_mp4(src, dst)
             return src, dst, ok, reason
 
+        # ThreadPoolExecutor's own default, made explicit to size the window
+        workers = workers or min(32, (os.cpu_count() or 1) + 4)
         with ThreadPoolExecutor(max_workers=workers) as ex:
-            futs = {ex.submit(_one, s, d): (s, d) for (s, d) in targets}
-            for fut in as_completed(futs):
+
+            def _submit(
+                t: tuple[Path, Path],
+            ) -> Future[tuple[Path, Path, bool, str | None]]:
+                return ex.submit(_one, *t)
+
+            for _, fut in _windowed(_submit, todo, 2 * workers):
                 src, dst, ok, reason = fut.result()
                 if on_progress:
                     on_progress(1)
@@ -388,8 +562,10 @@ class Mp4ConvertService(CleanupService):
         self,
         reporter: ProgressReporter | None = None,
         workers: int | None = None,  # NEW
+        targets: Sequence[tuple[Path, Path]] | None = None,
     ) -> list[tuple[Path, Path, bool, str | None]]:
-        targets = self.enumerate_targets(reporter=reporter)
+        if targets is None:  # no plan() result handed over: walk the tree now
+            targets = self.enumerate_targets(reporter=reporter)
         total = len(targets)
         if reporter:
             reporter.start("convert", total=total, text="Converting to MP4…")
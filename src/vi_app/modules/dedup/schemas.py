@@ -24,6 +24,14 @@ class DedupItem(BaseModel):
 class DedupRequest(BaseModel):
     root: DirectoryPath = Field(..., example="/data/input")
     strategy: DedupStrategy = Field(DedupStrategy.content, example="content")
+    hash_name: Optional[str] = Field(  # noqa: UP045
+        default=None,
+        description=(
+            "hashlib algorithm for the metadata strategy "
+            "(default: $VI_DEDUP_HASH, else sha256)."
+        ),
+        examples=["blake2b"],
+    )
     move_duplicates_to: Optional[str] = Field(  # noqa: UP045
         None,
         description="Destination directory for moved duplicates when dry_run=false.",
@@ -1,11 +1,12 @@
 # src/vi_app/modules/dedup/service.py
 from __future__ import annotations
 
-import shutil
+import os
 from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from vi_app.core.paths import move_file
 from vi_app.core.progress import ProgressReporter
 
 from .schemas import DedupItem, DedupRequest, DedupStrategy
@@ -18,17 +19,17 @@ class DedupService:
     """OOP wrapper around planning and applying dedup operations."""
 
     # ---- strategy resolution -------------------------------------------------
-    def _select(self, strategy: DedupStrategy):
-        if strategy == DedupStrategy.content:
+    def _select(self, req: DedupRequest):
+        if req.strategy == DedupStrategy.content:
             return ContentStrategy()
-        return MetadataStrategy()
+        return MetadataStrategy(hash_name=req.hash_name)
 
     # ---- public API ----------------------------------------------------------
     def plan(
         self, req: DedupRequest, reporter: ProgressReporter | None = None
     ) -> list[DedupItem]:
         """Compute duplicate clusters using the selected strategy."""
-        strat = self._select(req.strategy)
+        strat = self._select(req)
         return strat.run(Path(req.root), reporter=reporter)
 
     def apply(
@@ -43,6 +44,10 @@ class DedupService:
             return clusters
 
         # Prepare move tasks: (src, dst)
+        # Names present in (or already planned for) each target folder: listed once per
+        # folder, so picking a free '_dupe(n)' name never stats the filesystem
+        taken: dict[Path, set[str]] = {}
+
         def _moves() -> Iterable[tuple[Path, Path]]:
             for cluster in clusters:
                 keep = Path(cluster.keep).resolve()
@@ -63,12 +68,20 @@ class DedupService:
                     target_dir = Path(
                         req.move_duplicates_to or (src.parent / "duplicate")
                     )
-                    target_dir.mkdir(parents=True, exist_ok=True)
+                    names = taken.get(target_dir)
+                    if names is None:  # first use: create the folder once, list it once
+                        target_dir.mkdir(parents=True, exist_ok=True)
+                        names = taken[target_dir] = self._list_names(target_dir)
 
                     # Compute first candidate for this duplicate
                     dst = self._next_dupe_path(
-                        keeper=keep, dup=src, target_dir=target_dir, start_n=counter
+                        keeper=keep,
+                        dup=src,
+                        target_dir=target_dir,
+                        start_n=counter,
+                        taken=names,
                     )
+                    names.add(dst.name)
                     counter += 1  # advance nominal per-cluster counter
 
                     yield (src, dst)
@@ -93,13 +106,13 @@ class DedupService:
                 if dst.exists():
                     dst = self._bump_until_free(dst)
 
-                shutil.move(str(src), str(dst))
+                move_file(src, dst)
                 return (src, True, None)
             except Exception:
                 # One more attempt with a bumped name (handles rare races)
                 try:
                     fallback = self._bump_until_free(dst)
-                    shutil.move(str(src), str(fallback))
+                    move_file(src, fallback)
                     return (src, True, None)
                 except Exception as e2:
                     return (src, False, f"error:{e2.__class__.__name__}")
@@ -121,21 +134,37 @@ class DedupService:
         return clusters
 
     # ---- helpers -------------------------------------------------------------
+    @staticmethod
+    def _list_names(folder: Path) -> set[str]:
+        try:
+            with os.scandir(folder) as it:
+                return {e.name for e in it}
+        except OSError:
+            return set()
+
     @staticmethod
     def _next_dupe_path(
-        keeper: Path, dup: Path, target_dir: Path, start_n: int = 1
+        keeper: Path,
+        dup: Path,
+        target_dir: Path,
+        start_n: int = 1,
+        taken: set[str] | None = None,
     ) -> Path:
         """
         Build a destination path like '<keeper_stem>_dupe(n)<dup_ext>' in target_dir,
-        bumping n until the path is free.
+        bumping n until the path is free. With `taken` (the folder's names), probes are
+        set lookups instead of one exists() syscall each.
         """
         base_stem = keeper.stem
         ext = dup.suffix  # keep the duplicate's own extension
         n = max(1, int(start_n))
         while True:
-            candidate = target_dir / f"{base_stem}_dupe({n}){ext}"
-            if not candidate.exists():
-                return candidate
+            name = f"{base_stem}_dupe({n}){ext}"
+            if taken is not None:
+                if name not in taken:
+                    return target_dir / name
+            elif not (target_dir / name).exists():
+                return target_dir / name
             n += 1
 
     @staticmethod
@@ -1,21 +1,28 @@
 # src/vi_app/modules/dedup/strategies/content.py
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import imagehash
 from PIL import Image
 
+from vi_app.core.hash_cache import HashCache
 from vi_app.core.progress import ProgressReporter
 
 from ..schemas import DedupItem
 from .base import get_worker_count
 from .image_base import ImageStrategyBase
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _Item:
     path: Path
     hash: int
@@ -23,16 +30,71 @@ class _Item:
     size: int
 
 
+class _BKNode:
+    __slots__ = ("hash", "idxs", "children")
+
+    def __init__(self, hash: int, idx: int) -> None:
+        self.hash = hash
+        self.idxs = [idx]  # every item whose hash is exactly `hash`
+        self.children: dict[int, _BKNode] = {}
+
+
+class _BKTree:
+    """
+    Burkhard-Keller tree over int hashes under the hamming metric.
+    A radius query only descends into children whose edge distance is within
+    `threshold` of the query's distance to the node (triangle inequality),
+    so most of the tree is never compared against.
+    Identical hashes (byte-for-byte copies, re-saves) share a single node, so
+    they cost one comparison per query instead of one each.
+    """
+
+    def __init__(self) -> None:
+        self._root: _BKNode | None = None
+
+    def add(self, hash: int, idx: int) -> None:
+        if self._root is None:
+            self._root = _BKNode(hash, idx)
+            return
+        node = self._root
+        while True:
+            d = (node.hash ^ hash).bit_count()
+            if d == 0:
+                node.idxs.append(idx)
+                return
+            child = node.children.get(d)
+            if child is None:
+                node.children[d] = _BKNode(hash, idx)
+                return
+            node = child
+
+    def query(self, hash: int, threshold: int) -> list[int]:
+        """Return the idx of every stored hash within `threshold` of `hash`."""
+        found: list[int] = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            d = (node.hash ^ hash).bit_count()
+            if d <= threshold:
+                found.extend(node.idxs)
+            lo, hi = d - threshold, d + threshold
+            stack.extend(c for k, c in node.children.items() if lo <= k <= hi)
+        return found
+
+
 class ContentStrategy(ImageStrategyBase):
     """
     Perceptual (near-duplicate) strategy using pHash (configurable).
     Reports progress for: scan -> hash -> cluster -> select.
-    Hash phase is parallelised with a thread pool.
+    Hash phase is parallelised with a process pool (pHash's DCT is CPU-bound).
+    A `hash_fn` that can't be pickled (lambda, local function) still works, but
+    is run on a thread pool instead.
+    Defaults to imagehash.phash, imported on first run (imagehash pulls in numpy/scipy).
     """
 
     def __init__(
         self,
-        hash_fn=imagehash.phash,
+        hash_fn=None,
         hash_size: int = 16,  # 256-bit pHash
         hamming_threshold: int = 6,
         exts: set[str] | None = None,
@@ -51,64 +113,87 @@ class ContentStrategy(ImageStrategyBase):
         # SCAN
         if reporter:
             reporter.start("scan", total=None, text="Discovering images…")
-        files = list(self._iter_images(root, reporter=reporter))
+        scanned = list(self._scan_images(root, reporter=reporter))
         if reporter:
             reporter.end("scan")
 
-        # HASH (parallel)
-        workers = get_worker_count(
-            io_bound=True
-        )  # PIL decode + hashing benefit from threads
+        # HASH (parallel, one process per core)
+        workers = get_worker_count(io_bound=False)  # decode + DCT are CPU-bound
         if reporter:
             reporter.start(
-                "hash", total=len(files), text=f"Computing pHash… (workers={workers})"
+                "hash", total=len(scanned), text=f"Computing pHash… (workers={workers})"
             )
 
-        items: list[_Item] = []
+        hash_fn = self.hash_fn
+        if hash_fn is None:
+            import imagehash
+
+            hash_fn = imagehash.phash
 
-        def _compute_item(p: Path) -> _Item:
-            hv, pixels = self._phash_int(p)
-            try:
-                size = p.stat().st_size
-            except OSError:
-                size = 0
-            return _Item(path=p, hash=hv, pixels=pixels, size=size)
-
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futs = {ex.submit(_compute_item, p): p for p in files}
-            for fut in as_completed(futs):
-                p = futs[fut]
-                try:
-                    it = fut.result()
-                    items.append(it)
-                except Exception:
-                    # Failed hash/open => treat as zeroed item, still advance progress
-                    items.append(_Item(path=p, hash=0, pixels=0, size=0))
+        items: list[_Item] = []
+        cache = HashCache.open_default()
+        kind = f"{_qualified_name(hash_fn)}:{self.hash_size}"
+        try:
+            # Unchanged files (same size + mtime) come straight from the cache
+            todo: list[tuple[Path, int, int]] = []
+            for p, size, mtime_ns in scanned:
+                hit = cache.get(p, kind, size, mtime_ns) if cache else None
+                if hit is None:
+                    todo.append((p, size, mtime_ns))
+                    continue
+                items.append(_Item(p, int(hit[0], 16), hit[1], size))
                 if reporter:
                     reporter.update("hash", 1, text=p.name)
 
+            if todo:
+                hash_one = partial(_hash_one, hash_fn=hash_fn, hash_size=self.hash_size)
+                files = [p for p, _, _ in todo]
+                sizes = [size for _, size, _ in todo]
+                with _hash_executor(hash_fn, workers) as ex:
+                    hashed = ex.map(hash_one, files, sizes, chunksize=32)
+                    for it, (_, _, mtime_ns) in zip(hashed, todo, strict=True):
+                        items.append(it)
+                        if cache and it.pixels:  # don't cache failed decodes
+                            cache.put(
+                                it.path,
+                                kind,
+                                it.size,
+                                mtime_ns,
+                                f"{it.hash:x}",
+                                it.pixels,
+                            )
+                        if reporter:
+                            reporter.update("hash", 1, text=it.path.name)
+        finally:
+            if cache:
+                cache.close()
+
         if reporter:
             reporter.end("hash")
 
-        # CLUSTER (greedy, sequential)
+        # CLUSTER (greedy, BK-tree indexed)
         if reporter:
             reporter.start("cluster", total=len(items), text="Clustering near-dupes…")
-        remaining = sorted(
+        ranked = sorted(
             items, key=lambda it: (it.pixels, it.size, str(it.path)), reverse=True
         )
+        tree = _BKTree()
+        for idx, it in enumerate(ranked):
+            tree.add(it.hash, idx)
+        assigned = [False] * len(ranked)
         clusters: list[list[_Item]] = []
-        while remaining:
-            seed = remaining.pop(0)
+        for i, seed in enumerate(ranked):
+            if assigned[i]:
+                continue
+            assigned[i] = True
             if reporter:
                 reporter.update("cluster", 1, text=seed.path.name)
             cluster = [seed]
-            still: list[_Item] = []
-            for it in remaining:
-                if self._hamming(seed.hash, it.hash) <= self.hamming_threshold:
-                    cluster.append(it)
-                else:
-                    still.append(it)
-            remaining = still
+            # sorted() keeps members in rank order, as the linear scan did
+            for j in sorted(tree.query(seed.hash, self.hamming_threshold)):
+                if not assigned[j]:
+                    assigned[j] = True
+                    cluster.append(ranked[j])
             if len(cluster) > 1:
                 clusters.append(cluster)
         if reporter:
@@ -124,41 +209,96 @@ class ContentStrategy(ImageStrategyBase):
             if dups:
                 results.append(DedupItem(keep=str(keeper.path), duplicates=dups))
             if reporter:
-                reporter.update("select", 1, text=Path(keeper.path).name)
+                reporter.update("select", 1, text=keeper.path.name)
         if reporter:
             reporter.end("select")
 
         return results
 
     # ---- helpers ----
-    def _safe_open_image(self, p: Path) -> Image.Image | None:
+    @staticmethod
+    def _best_of(group: list[_Item]) -> _Item:
+        return max(group, key=lambda it: (it.pixels, it.size, str(it.path)))
+
+
+def _qualified_name(fn: object) -> str:
+    """Cache-kind label: module + qualname, so same-named functions don't collide."""
+    module = getattr(fn, "__module__", None) or ""
+    name = getattr(fn, "__qualname__", None) or getattr(fn, "__name__", "hash")
+    return f"{module}.{name}" if module else f"{name}"
+
+
+def _hash_executor(hash_fn, workers: int) -> Executor:
+    """
+    Spawned process pool for the hash phase; falls back to threads when `hash_fn`
+    can't be pickled for the workers (lambdas, locally defined functions).
+    """
+    try:
+        pickle.dumps(hash_fn)
+    except Exception:
+        return ThreadPoolExecutor(max_workers=workers, initializer=_init_hash_worker)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_hash_worker,
+    )
+
+
+# ---- process-pool workers (module level so they can be pickled) ----
+def _init_hash_worker() -> None:
+    """Make HEIC/HEIF decodable inside freshly spawned worker processes."""
+    try:
+        from pillow_heif import register_heif_opener
+
+        register_heif_opener()
+    except Exception:
+        pass
+
+
+def _phash_int(p: Path, hash_fn, hash_size: int) -> tuple[int, int]:
+    try:
+        im = Image.open(p)
+    except Exception:
+        return 0, 0
+    try:
+        # Resolution comes from the header, before draft() shrinks the image
+        pixels = im.width * im.height
+        # pHash only looks at a (hash_size*4)² grayscale thumbnail, so let libjpeg
+        # decode straight to grayscale at a reduced DCT scale (no-op for non-JPEG).
+        side = hash_size * 4
         try:
-            im = Image.open(p)
-            im.load()
-            return im
+            im.draft("L", (side, side))
         except Exception:
-            return None
-
-    def _phash_int(self, p: Path) -> tuple[int, int]:
-        im = self._safe_open_image(p)
-        if im is None:
-            return 0, 0
+            pass
+        im.load()
+        h = hash_fn(im, hash_size=hash_size)
+        return _bits_to_int(h.hash), pixels
+    except Exception:
+        return 0, 0
+    finally:
         try:
-            h = self.hash_fn(im, hash_size=self.hash_size)
-            pixels = im.width * im.height
-            return int(str(h), 16), pixels
+            im.close()
         except Exception:
-            return 0, 0
-        finally:
-            try:
-                im.close()
-            except Exception:
-                pass
+            pass
 
-    @staticmethod
-    def _hamming(a: int, b: int) -> int:
-        return (a ^ b).bit_count()
 
-    @staticmethod
-    def _best_of(group: list[_Item]) -> _Item:
-        return max(group, key=lambda it: (it.pixels, it.size, str(it.path)))
+def _bits_to_int(bits: np.ndarray) -> int:
+    """
+    Pack a boolean hash matrix into an int (row-major, MSB first) in one C pass.
+    Same value as int(str(imagehash), 16), without the per-bit hex round-trip.
+    """
+    import numpy as np  # already loaded by imagehash in the workers
+
+    flat = bits.reshape(-1)
+    packed = np.packbits(flat)
+    return int.from_bytes(packed.tobytes(), "big") >> (-int(flat.size) % 8)
+
+
+def _hash_one(p: Path, size: int, hash_fn, hash_size: int) -> _Item:
+    # Never raise: Executor.map would abort the whole batch on the first error.
+    try:
+        hv, pixels = _phash_int(p, hash_fn, hash_size)
+        return _Item(path=p, hash=hv, pixels=pixels, size=size)
+    except Exception:
+        # Failed hash/open => treat as zeroed item, still advance progress
+        return _Item(path=p, hash=0, pixels=0, size=0)
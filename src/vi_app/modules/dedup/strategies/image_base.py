@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Iterable
 from pathlib import Path
 
+from vi_app.core.paths import scan_files
 from vi_app.core.progress import ProgressReporter
 
 from .base import DedupStrategyBase
@@ -12,6 +13,8 @@ from .base import DedupStrategyBase
 class ImageStrategyBase(DedupStrategyBase):
     """Small DRY base for strategies that operate over image files."""
 
+    scan_workers = 8  # directory listings run concurrently; order doesn't matter here
+
     def __init__(self, exts: set[str] | None = None) -> None:
         self.exts = exts or {
             ".jpg",
@@ -25,11 +28,17 @@ class ImageStrategyBase(DedupStrategyBase):
             ".heif",
         }
 
-    def _iter_images(
+    def _scan_images(
         self, root: Path, reporter: ProgressReporter | None = None
-    ) -> Iterable[Path]:
-        for p in root.rglob("*"):
-            if p.is_file() and p.suffix.lower() in self.exts:
-                if reporter:
-                    reporter.update("scan", 1, text=p.name)
-                yield p
+    ) -> Iterable[tuple[Path, int, int]]:
+        """Yield (path, size, mtime_ns) per image, taken from the scandir entry."""
+        entries = scan_files(root, exts=self.exts, workers=self.scan_workers, stat=True)
+        for entry in entries:
+            try:
+                st = entry.stat()
+                size, mtime_ns = st.st_size, st.st_mtime_ns
+            except OSError:
+                size, mtime_ns = 0, 0
+            if reporter:
+                reporter.update("scan", 1, text=entry.name)
+            yield Path(entry.path), size, mtime_ns
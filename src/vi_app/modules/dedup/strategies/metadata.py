@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from io import BufferedIOBase, BufferedReader
 from pathlib import Path
 
 from PIL import Image
 
+from vi_app.core.errors import BadRequest
+from vi_app.core.hash_cache import HashCache
 from vi_app.core.progress import ProgressReporter
 
 from ..schemas import DedupItem
@@ -15,23 +20,39 @@ from .base import get_worker_count
 from .image_base import ImageStrategyBase
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Item:
     path: Path
-    sha256: str
+    digest: str
     pixels: int
     size: int
 
 
 class MetadataStrategy(ImageStrategyBase):
     """
-    Exact-byte duplicate detection via SHA-256; ranks keepers by resolution/size/path.
-    Reports progress for: scan -> hash -> bucket -> select.
+    Exact-byte duplicate detection via a content digest (SHA-256 by default; any
+    hashlib name, e.g. "blake2b", is accepted, either passed in or taken from the
+    VI_DEDUP_HASH environment variable). Ranks keepers by resolution/size/path.
+    Only files sharing both size and first 64 KiB are fully hashed.
+    Reports progress for: scan -> prefilter -> hash -> bucket -> select.
     Hash phase is parallelised with a thread pool.
     """
 
-    def __init__(self, exts: set[str] | None = None) -> None:
+    HEAD_BYTES = 64 * 1024  # prefilter read per size-colliding file
+    MMAP_MIN_BYTES = 8 * 1024 * 1024  # hash larger files via mmap
+
+    def __init__(
+        self, exts: set[str] | None = None, hash_name: str | None = None
+    ) -> None:
         super().__init__(exts)
+        hash_name = hash_name or os.getenv("VI_DEDUP_HASH") or "sha256"
+        try:
+            probe = hashlib.new(hash_name)  # fail fast on an unknown algorithm
+        except ValueError as e:
+            raise BadRequest(f"Unknown hash algorithm {hash_name!r}") from e
+        if probe.digest_size == 0:  # shake_*: hexdigest() needs a length
+            raise BadRequest(f"Variable-length hash {hash_name!r} is not supported")
+        self.hash_name = hash_name
 
     def run(
         self, root: Path, reporter: ProgressReporter | None = None
@@ -41,44 +62,72 @@ class MetadataStrategy(ImageStrategyBase):
         # SCAN
         if reporter:
             reporter.start("scan", total=None, text="Discovering images…")
-        files = list(self._iter_images(root, reporter=reporter))
+        files = list(self._scan_images(root, reporter=reporter))
         if reporter:
             reporter.end("scan")
 
-        # HASH (parallel sha256)
         workers = get_worker_count(
             io_bound=True
         )  # hashlib (C) + disk IO -> threads scale
+
+        # PREFILTER: identical files share a size and their first bytes, so only
+        # files colliding on both are worth a full read
+        files = self._prefilter(files, workers, reporter)
+
+        # HASH (parallel digest)
         if reporter:
             reporter.start(
                 "hash",
                 total=len(files),
-                text=f"Hashing files (SHA-256)… (workers={workers})",
+                text=f"Hashing files ({self.hash_name})… (workers={workers})",
             )
 
         items: list[_Item] = []
 
-        def _hash_one(p: Path) -> _Item:
-            sha = self._sha256_file(p)
-            px = self._pixels(p)
-            try:
-                size = p.stat().st_size
-            except OSError:
-                size = 0
-            return _Item(p, sha, px, size)
+        def _hash_one(p: Path, size: int) -> _Item:
+            digest, px = self._digest_and_pixels(p, self.hash_name, size)
+            return _Item(p, digest, px, size)
 
-        with ThreadPoolExecutor(max_workers=workers) as ex:
-            futs = {ex.submit(_hash_one, p): p for p in files}
-            for fut in as_completed(futs):
-                p = futs[fut]
-                try:
-                    it = fut.result()
-                    items.append(it)
-                except Exception:
-                    items.append(_Item(p, "", 0, 0))
+        cache = HashCache.open_default()
+        try:
+            # Unchanged files (same size + mtime) come straight from the cache
+            todo: list[tuple[Path, int, int]] = []
+            for p, size, mtime_ns in files:
+                hit = cache.get(p, self.hash_name, size, mtime_ns) if cache else None
+                if hit is None:
+                    todo.append((p, size, mtime_ns))
+                    continue
+                items.append(_Item(p, hit[0], hit[1], size))
                 if reporter:
                     reporter.update("hash", 1, text=p.name)
 
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futs = {
+                    ex.submit(_hash_one, p, size): (p, mtime_ns)
+                    for p, size, mtime_ns in todo
+                }
+                for fut in as_completed(futs):
+                    p, mtime_ns = futs[fut]
+                    try:
+                        it = fut.result()
+                        items.append(it)
+                        if cache:
+                            cache.put(
+                                p,
+                                self.hash_name,
+                                it.size,
+                                mtime_ns,
+                                it.digest,
+                                it.pixels,
+                            )
+                    except Exception:
+                        items.append(_Item(p, "", 0, 0))
+                    if reporter:
+                        reporter.update("hash", 1, text=p.name)
+        finally:
+            if cache:
+                cache.close()
+
         if reporter:
             reporter.end("hash")
 
@@ -89,7 +138,8 @@ class MetadataStrategy(ImageStrategyBase):
             )
         buckets: dict[str, list[_Item]] = {}
         for it in items:
-            buckets.setdefault(it.sha256, []).append(it)
+            if it.digest:  # unreadable files have no digest; never group them
+                buckets.setdefault(it.digest, []).append(it)
             if reporter:
                 reporter.update("bucket", 1, text=it.path.name)
         if reporter:
@@ -106,26 +156,89 @@ class MetadataStrategy(ImageStrategyBase):
             if dups:
                 results.append(DedupItem(keep=str(keeper.path), duplicates=dups))
             if reporter:
-                reporter.update("select", 1, text=Path(keeper.path).name)
+                reporter.update("select", 1, text=keeper.path.name)
         if reporter:
             reporter.end("select")
 
         return results
 
     # ---- helpers ----
-    @staticmethod
-    def _sha256_file(p: Path, chunk: int = 1024 * 1024) -> str:
-        h = hashlib.sha256()
+    def _prefilter(
+        self,
+        files: list[tuple[Path, int, int]],
+        workers: int,
+        reporter: ProgressReporter | None = None,
+    ) -> list[tuple[Path, int, int]]:
+        """Keep only files whose (size, head digest) is shared with another file."""
+        by_size: dict[int, list[tuple[Path, int, int]]] = {}
+        for rec in files:
+            by_size.setdefault(rec[1], []).append(rec)
+        same_size = [rec for grp in by_size.values() if len(grp) > 1 for rec in grp]
+
+        if reporter:
+            reporter.start(
+                "prefilter", total=len(same_size), text="Comparing file heads…"
+            )
+        by_head: dict[tuple[int, str], list[tuple[Path, int, int]]] = {}
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            heads = ex.map(self._head_digest, [p for p, _, _ in same_size])
+            for rec, head in zip(same_size, heads, strict=True):
+                if head is not None:  # unreadable files can't be hashed either
+                    by_head.setdefault((rec[1], head), []).append(rec)
+                if reporter:
+                    reporter.update("prefilter", 1, text=rec[0].name)
+        if reporter:
+            reporter.end("prefilter")
+
+        return [rec for grp in by_head.values() if len(grp) > 1 for rec in grp]
+
+    @classmethod
+    def _head_digest(cls, p: Path) -> str | None:
+        try:
+            with p.open("rb") as f:
+                head = f.read(cls.HEAD_BYTES)
+        except OSError:
+            return None
+        return hashlib.blake2b(head, digest_size=16, usedforsecurity=False).hexdigest()
+
+    @classmethod
+    def _digest_and_pixels(
+        cls, p: Path, hash_name: str, size: int = 0
+    ) -> tuple[str, int]:
+        """One open per file: parse the image header, then rewind and hash the bytes."""
         with p.open("rb") as f:
-            for part in iter(lambda: f.read(chunk), b""):
-                h.update(part)
+            px = cls._pixels(f)
+            if size >= cls.MMAP_MIN_BYTES:
+                # Large RAWs/TIFFs: hash straight from the page cache in one update()
+                # (GIL released throughout), no chunk copies into Python buffers
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        h = hashlib.new(hash_name, usedforsecurity=False)
+                        h.update(mm)
+                        return h.hexdigest(), px
+                except (OSError, ValueError):
+                    pass  # e.g. file shrank or fs without mmap; stream instead
+            f.seek(0)
+            return cls._digest_stream(f, hash_name), px
+
+    @staticmethod
+    def _digest_stream(
+        f: BufferedIOBase, hash_name: str = "sha256", chunk: int = 1024 * 1024
+    ) -> str:
+        # readinto() a single reusable buffer: no new bytes object per chunk.
+        # hashlib releases the GIL on large updates, so pool threads hash in parallel.
+        h = hashlib.new(hash_name, usedforsecurity=False)
+        buf = bytearray(chunk)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
         return h.hexdigest()
 
     @staticmethod
-    def _pixels(p: Path) -> int:
+    def _pixels(f: BufferedReader) -> int:
+        # Image.open only parses the header; the size is known without decoding
         try:
-            with Image.open(p) as im:
-                im.load()
+            with Image.open(f) as im:
                 return im.width * im.height
         except Exception:
             return 0